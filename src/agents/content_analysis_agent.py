@@ -10,11 +10,18 @@ This agent:
 """
 
 import logging
-from typing import Any, Dict
+import re
+from collections import Counter
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 from google.adk import Agent
+from google.genai import types
+from pydantic import BaseModel
 
 from ..tools import get_topic_priorities
+from ..utils.config_loader import config_loader
 
 logger = logging.getLogger(__name__)
 
@@ -25,40 +32,132 @@ AGENT_DESCRIPTION = (
     "Analyzes articles and selects top 20 based on topic priorities and relevance"
 )
 AGENT_OUTPUT_KEY = "selected_articles"
+AGENT_TIMEOUT_MS = 60_000  # Per-request cap on Gemini calls
+
+# Selection rules (shared by the local scorer and AGENT_INSTRUCTION)
+MAX_SELECTED_ARTICLES = 20
+MAX_ARTICLES_PER_TOPIC = 10
+BOOKMARK_PRIORITY = 11
+BOOKMARK_TOPIC = "Bookmark"
+# Articles matching no topic fill any slots left after topic matches
+UNMATCHED_PRIORITY = 0
+UNMATCHED_TOPIC = "Other"
+
+# Keywords this short (or containing capitals) are matched case-sensitively
+CASE_SENSITIVE_MAX_LENGTH = 3
+
+# Excerpt characters sent per article in the compact analysis prompt
+PROMPT_EXCERPT_CHARS = 300
 
 AGENT_INSTRUCTION = """
-You analyze articles and select the top 20 for a newsletter based on topic priorities.
-
-STEP 1: Call get_topic_priorities() tool
-This returns topics with priority scores (7-11) and keywords. You MUST call this tool first.
-
-STEP 2: Match each article to topics
-For each article:
-- Read the title and excerpt
-- Match against topic keywords from get_topic_priorities()
-- Assign the topic's priority score (7-11)
-- Bookmarks (is_bookmark=true) automatically get priority 11
-
-STEP 3: Select top 20 articles
-Rules:
-- Maximum 10 articles per topic (ensures diversity)
-- Rank by priority score (highest first)
-- Prefer recent articles if priorities are equal
-- Include bookmarks first (priority 11)
-
-STEP 4: Return JSON array
-Return ONLY a JSON array with these fields for each article:
-- All original fields (url, title, excerpt, source, category, published_date, is_bookmark)
-- priority: number (7-11) - the score you assigned
-- matched_topic: string - which topic it matched
-
-Example:
-[{"url": "...", "title": "...", "excerpt": "...", "source": "...", "category": "...", "published_date": "...", "is_bookmark": false, "priority": 10, "matched_topic": "AI/ML"}]
-
-CRITICAL: Return ONLY valid JSON. No explanations. Call get_topic_priorities() first.
+You are the content analysis agent selecting the top 20 articles for a weekly newsletter.
+
+1. Call get_topic_priorities() first. It returns topics with keywords and priority scores (7-11).
+2. Articles are given as {i: index, t: title, x: excerpt, c: category}. Match t and x against the
+   topic keywords and assign that topic's priority.
+3. Bookmarks (c="bookmark") always get priority 11.
+4. Select the top 20 by priority: bookmarks first, max 10 per topic.
+5. Return each selected article's index i with its priority and matched_topic.
 """
 
 
+class ArticleSelection(BaseModel):
+    """A selected article index with its assigned priority (structured output schema)."""
+
+    i: int
+    priority: int
+    matched_topic: str
+
+
+class TopicMatcher:
+    """Match article text against every topic keyword with one compiled regex."""
+
+    def __init__(self, topics: List[Dict[str, Any]]):
+        """
+        Build the matcher from topic configuration.
+
+        Short or capitalized keywords ("AI", "Go", "React") are matched
+        case-sensitively so ordinary words like "go" or "react" don't hit a
+        topic; longer lowercase keywords ("machine learning") match any case.
+
+        Args:
+            topics: Topic dicts with name, keywords and priority
+        """
+        # Keyword -> (topic name, priority), split by how the keyword is
+        # compared (case-insensitive ones keyed casefolded); overlapping
+        # keywords keep the highest-priority topic
+        self._exact: Dict[str, Tuple[str, int]] = {}
+        self._folded: Dict[str, Tuple[str, int]] = {}
+        folded_keywords = set()
+        for topic in topics:
+            name = topic.get("name", "")
+            priority = int(topic.get("priority", 0))
+            for keyword in topic.get("keywords") or []:
+                keyword = str(keyword)
+                if _is_case_sensitive(keyword):
+                    keywords, key = self._exact, keyword
+                else:
+                    keywords, key = self._folded, keyword.casefold()
+                    folded_keywords.add(keyword)
+                if key not in keywords or priority > keywords[key][1]:
+                    keywords[key] = (name, priority)
+
+        # Longest keywords first so "machine learning" wins over shorter prefixes;
+        # lookarounds give whole-word matches that also work for "C++"
+        pieces = [(key, re.escape(key)) for key in self._exact]
+        pieces += [(key, f"(?i:{re.escape(key)})") for key in folded_keywords]
+        alternation = "|".join(
+            piece for _, piece in sorted(pieces, key=lambda item: len(item[0]), reverse=True)
+        )
+        self._pattern = (
+            re.compile(rf"(?<!\w)(?:{alternation})(?!\w)") if alternation else None
+        )
+
+    def match(self, text: str) -> Optional[Tuple[str, int]]:
+        """
+        Find the highest-priority topic mentioned in text.
+
+        Args:
+            text: Text to scan (e.g., title + excerpt)
+
+        Returns:
+            Tuple of (topic name, priority), or None if no keyword matched
+        """
+        if self._pattern is None or not text:
+            return None
+
+        best = None
+        for match in self._pattern.finditer(text):
+            word = match.group(0)
+            # IGNORECASE also matches Unicode variants (e.g. "ſ" for "s"),
+            # which casefold back onto the stored key
+            hit = self._exact.get(word) or self._folded.get(word.casefold())
+            if hit is None:
+                continue
+            if best is None or hit[1] > best[1]:
+                best = hit
+        return best
+
+
+def _is_case_sensitive(keyword: str) -> bool:
+    """Whether a keyword must match exactly (short or containing capitals)."""
+    return len(keyword) <= CASE_SENSITIVE_MAX_LENGTH or keyword != keyword.lower()
+
+
+def _published_timestamp(value: Optional[str]) -> float:
+    """Convert an RSS (RFC 822) or ISO date string to a sortable timestamp."""
+    if not value:
+        return 0.0
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return 0.0
+
+
 class ContentAnalysisAgent:
     """Factory class for creating the ContentAnalysisAgent."""
 
@@ -78,7 +177,131 @@ class ContentAnalysisAgent:
             instruction=AGENT_INSTRUCTION,
             tools=[get_topic_priorities],  # Add the function-based tool
             output_key=AGENT_OUTPUT_KEY,  # Limit context passed to next agent
+            output_schema=List[ArticleSelection],  # Constrained JSON, no free-form prose
+            generate_content_config=types.GenerateContentConfig(
+                http_options=types.HttpOptions(timeout=AGENT_TIMEOUT_MS),
+            ),
         )
 
         logger.info(f"Created {AGENT_NAME} with model {AGENT_MODEL}")
         return agent
+
+    @staticmethod
+    def select_articles(
+        articles: List[Dict[str, Any]],
+        topics: Optional[List[Dict[str, Any]]] = None,
+        limit: int = MAX_SELECTED_ARTICLES,
+        per_topic_limit: int = MAX_ARTICLES_PER_TOPIC,
+    ) -> List[Dict[str, Any]]:
+        """
+        Score and select articles locally by topic keyword matching.
+
+        Applies the same rules the agent is instructed with: bookmarks first
+        at priority 11, then highest priority, newest first on ties, with at
+        most per_topic_limit articles per topic. Slots still open after that
+        are filled with the newest articles that matched no topic.
+
+        Args:
+            articles: Discovered articles (url, title, excerpt, ...)
+            topics: Topic configuration. Defaults to config/topic_priorities.yaml
+            limit: Maximum number of articles to select
+            per_topic_limit: Maximum number of articles per topic
+
+        Returns:
+            Selected articles with priority and matched_topic fields added
+        """
+        if topics is None:
+            topics = config_loader.get_topic_priorities().get("topics") or []
+        matcher = TopicMatcher(topics)
+
+        bookmarks = []
+        candidates = []
+        unmatched = []
+        for article in articles:
+            if article.get("is_bookmark"):
+                bookmarks.append(
+                    {**article, "priority": BOOKMARK_PRIORITY, "matched_topic": BOOKMARK_TOPIC}
+                )
+                continue
+
+            text = f"{article.get('title') or ''} {article.get('excerpt') or ''}"
+            hit = matcher.match(text)
+            if hit:
+                topic, priority = hit
+                candidates.append({**article, "priority": priority, "matched_topic": topic})
+            else:
+                unmatched.append(
+                    {**article, "priority": UNMATCHED_PRIORITY, "matched_topic": UNMATCHED_TOPIC}
+                )
+
+        candidates.sort(
+            key=lambda a: (a["priority"], _published_timestamp(a.get("published_date"))),
+            reverse=True,
+        )
+        unmatched.sort(key=lambda a: _published_timestamp(a.get("published_date")), reverse=True)
+
+        selected = bookmarks[:limit]
+        per_topic: Counter = Counter()
+        for article in candidates:
+            if len(selected) >= limit:
+                break
+            if per_topic[article["matched_topic"]] >= per_topic_limit:
+                continue
+            per_topic[article["matched_topic"]] += 1
+            selected.append(article)
+
+        selected.extend(unmatched[: max(0, limit - len(selected))])
+        return selected
+
+    @staticmethod
+    def compact_articles(
+        articles: List[Dict[str, Any]], excerpt_chars: int = PROMPT_EXCERPT_CHARS
+    ) -> List[Dict[str, Any]]:
+        """
+        Project articles to the short-keyed fields the agent needs.
+
+        Args:
+            articles: Discovered articles
+            excerpt_chars: Maximum excerpt length to include
+
+        Returns:
+            List of {i, t, x, c} dicts, where i is the index into articles
+        """
+        return [
+            {
+                "i": index,
+                "t": article.get("title"),
+                "x": (article.get("excerpt") or "")[:excerpt_chars],
+                "c": article.get("category"),
+            }
+            for index, article in enumerate(articles)
+        ]
+
+    @staticmethod
+    def expand_selections(
+        articles: List[Dict[str, Any]], selections: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Map agent selections back onto the full articles.
+
+        Args:
+            articles: The articles passed to compact_articles
+            selections: Agent output of {i, priority, matched_topic} dicts
+
+        Returns:
+            Selected articles with priority and matched_topic fields added.
+            Out-of-range and repeated indices are skipped.
+        """
+        selected = []
+        seen = set()
+        for selection in selections:
+            index = selection.get("i")
+            if not isinstance(index, int) or not 0 <= index < len(articles) or index in seen:
+                continue
+            seen.add(index)
+            selected.append({
+                **articles[index],
+                "priority": selection.get("priority"),
+                "matched_topic": selection.get("matched_topic"),
+            })
+        return selected
@@ -9,10 +9,15 @@ This agent:
 5. Formats content for WordPress publication
 """
 
+import functools
+import html
 import logging
-from typing import Any, Dict
+from datetime import date, datetime, time
+from typing import Any, Dict, List
 
 from google.adk import Agent
+from google.genai import types
+from pydantic import BaseModel
 
 from ..utils.config_loader import config_loader
 from ..utils.date_formatter import format_newsletter_date
@@ -26,64 +31,75 @@ AGENT_DESCRIPTION = (
     "Writes article summaries in user's personal style and formats for publication"
 )
 AGENT_OUTPUT_KEY = "newsletter_content"  # Only pass newsletter HTML to next agent
+AGENT_TIMEOUT_MS = 180_000  # Per-request cap on Gemini calls
 
 AGENT_INSTRUCTION = """
-You are a content writing agent responsible for creating the weekly newsletter from RSS feed data.
-
-Your tasks:
-1. Receive 20 selected articles with RSS metadata (URL, title, excerpt, published_date)
-2. Load writing style guidelines from configuration
-3. Write a summary for each article (~200 tokens, ~150 words)
-4. Generate newsletter title with current date
-5. Create newsletter excerpt (150-200 words)
-6. Format everything for WordPress publication
-
-Content Sources:
-- All articles come from RSS feeds with metadata: title, excerpt, URL, and date
-- RSS excerpts provide the article summary - use this as your primary source
-- No full article content is extracted - this is a smart RSS reader
-- Expand and personalize the RSS excerpt in your writing style
-
-Writing Style Guidelines:
-- Study the style examples from mkfoster.com and fireflywp.com
-- Conversational but professional tone
-- Clear and concise technical writing
-- Use concrete examples when possible
-- Provide actionable insights
-- IMPORTANT: Do NOT use personal pronouns ("I", "I've", "my", etc.) in intro/conclusion paragraphs
-- This is AI-generated content - readers should know it's from the bot, not personally written
-- In article summaries, maintain third-person perspective or neutral voice
-
-Article Summary Guidelines (CRITICAL):
-- Each summary must be ~200 tokens (approximately 150 words)
-- Use the RSS excerpt as your foundation - it's already a good summary
-- Expand on the excerpt with your perspective and context
-- Highlight key takeaways or insights
-- Explain why it's interesting or valuable
-- Always include the source link
-- Maintain consistent voice across all summaries
-- Personalize the content - make it sound like you're recommending these articles to a friend
-
-Newsletter Format:
-- Do NOT include the main newsletter title in the HTML (WordPress displays it separately)
-- Start with a brief introduction paragraph (150-200 words)
-- Then present all 20 articles as numbered items
-HTML Structure:
-- Do NOT include <h1> or the main title - WordPress adds this automatically
-- Start with an <h2> header that says "From MyNewsRobot:" to identify AI-generated content
-- Follow with an introductory <p> paragraph (150-200 words, no personal pronouns)
-- Use <ol> for the numbered list of articles
-- Use <h3> for individual article titles within the list
-- Use <p> for article summaries
-- Use <a href="..."> for links
-- End with a conclusion paragraph (no personal pronouns)
-- Clean, semantic HTML only - no wrapper divs or containers
-- Use <a href="..."> for links
-- Clean, semantic HTML only - no wrapper divs or containers
-
-✍️ After writing the newsletter, provide ONLY the HTML content (no title, just intro + articles + conclusion).
+You are the content writing agent producing a weekly newsletter from RSS feed data.
+
+Input: the selected articles (url, title, excerpt, published_date) and writing style guidelines.
+
+Voice:
+- Conversational but professional; clear, concise, concrete, actionable.
+- No personal pronouns ("I", "I've", "my") - this is AI-generated content; keep a neutral voice.
+
+Each article summary:
+- ~200 tokens (~150 words), built on the RSS excerpt; add context, key takeaways and why it matters.
+- Always link to the source article.
+
+Output ONLY clean semantic HTML - no title, no <h1>, no wrapper divs:
+- <h2>From MyNewsRobot:</h2>, then an intro <p> (150-200 words)
+- <ol> of articles, each with an <h3> title, <p> summary and <a href="..."> link
+- A closing conclusion <p>
 """
 
+# Fan-out configuration: summaries are written in parallel batches, while a
+# separate short call writes the intro and conclusion
+SUMMARY_BATCH_SIZE = 5
+
+SUMMARY_AGENT_NAME = "ArticleSummaryAgent"
+SUMMARY_AGENT_DESCRIPTION = "Writes newsletter summaries for a batch of articles"
+SUMMARY_AGENT_OUTPUT_KEY = "article_summaries"
+SUMMARY_AGENT_INSTRUCTION = """
+You are the content writing agent summarizing a batch of articles for a weekly newsletter.
+
+Voice:
+- Conversational but professional; clear, concise, concrete, actionable.
+- No personal pronouns ("I", "I've", "my") - this is AI-generated content; keep a neutral voice.
+
+For every article in the request, in the same order:
+- Write ~200 tokens (~150 words) of plain text, built on the RSS excerpt; add context,
+  key takeaways and why it matters. No HTML or markdown.
+- Return it with the article's url and title unchanged.
+"""
+
+INTRO_AGENT_NAME = "NewsletterIntroAgent"
+INTRO_AGENT_DESCRIPTION = "Writes the newsletter introduction and conclusion"
+INTRO_AGENT_OUTPUT_KEY = "newsletter_intro"
+INTRO_AGENT_INSTRUCTION = """
+You are the content writing agent framing a weekly newsletter.
+
+From the article titles and excerpts provided:
+- introduction: 150-200 words of plain text on the week's themes.
+- conclusion: 2-3 sentences of key takeaways.
+Conversational but professional. No personal pronouns ("I", "I've", "my") - this is
+AI-generated content. No HTML or markdown.
+"""
+
+
+class ArticleSummary(BaseModel):
+    """A written summary for one article (structured output schema)."""
+
+    url: str
+    title: str
+    summary: str
+
+
+class NewsletterIntro(BaseModel):
+    """Newsletter introduction and conclusion (structured output schema)."""
+
+    introduction: str
+    conclusion: str
+
 
 class ContentWritingAgent:
     """Factory class for creating the ContentWritingAgent."""
@@ -104,11 +120,99 @@ class ContentWritingAgent:
             instruction=AGENT_INSTRUCTION,
             tools=[],  # No tools - uses LLM generation only
             output_key=AGENT_OUTPUT_KEY,  # Limit context passed to next agent
+            generate_content_config=types.GenerateContentConfig(
+                http_options=types.HttpOptions(timeout=AGENT_TIMEOUT_MS),
+            ),
         )
 
         logger.info(f"Created {AGENT_NAME} with model {AGENT_MODEL}")
         return agent
 
+    @staticmethod
+    def create_summary_agent() -> Agent:
+        """
+        Create and configure the agent that summarizes a batch of articles.
+
+        Returns:
+            Configured Agent instance returning a list of ArticleSummary
+        """
+        agent = Agent(
+            name=SUMMARY_AGENT_NAME,
+            model=AGENT_MODEL,
+            description=SUMMARY_AGENT_DESCRIPTION,
+            instruction=SUMMARY_AGENT_INSTRUCTION,
+            tools=[],
+            output_key=SUMMARY_AGENT_OUTPUT_KEY,
+            output_schema=List[ArticleSummary],
+            generate_content_config=types.GenerateContentConfig(
+                http_options=types.HttpOptions(timeout=AGENT_TIMEOUT_MS),
+            ),
+        )
+
+        logger.info(f"Created {SUMMARY_AGENT_NAME} with model {AGENT_MODEL}")
+        return agent
+
+    @staticmethod
+    def create_intro_agent() -> Agent:
+        """
+        Create and configure the agent that writes the intro and conclusion.
+
+        Returns:
+            Configured Agent instance returning a NewsletterIntro
+        """
+        agent = Agent(
+            name=INTRO_AGENT_NAME,
+            model=AGENT_MODEL,
+            description=INTRO_AGENT_DESCRIPTION,
+            instruction=INTRO_AGENT_INSTRUCTION,
+            tools=[],
+            output_key=INTRO_AGENT_OUTPUT_KEY,
+            output_schema=NewsletterIntro,
+            generate_content_config=types.GenerateContentConfig(
+                http_options=types.HttpOptions(timeout=AGENT_TIMEOUT_MS),
+            ),
+        )
+
+        logger.info(f"Created {INTRO_AGENT_NAME} with model {AGENT_MODEL}")
+        return agent
+
+    @staticmethod
+    def render_newsletter(
+        introduction: str, summaries: List[Dict[str, Any]], conclusion: str
+    ) -> str:
+        """
+        Assemble the newsletter HTML from its written parts.
+
+        Produces the structure described in AGENT_INSTRUCTION: a
+        "From MyNewsRobot:" header, intro paragraph, numbered article list
+        and conclusion, with no title or wrapper elements.
+
+        Args:
+            introduction: Introduction text
+            summaries: Dicts with url, title and summary, in display order
+            conclusion: Conclusion text
+
+        Returns:
+            Newsletter HTML content
+        """
+        items = []
+        for item in summaries:
+            url = html.escape(item.get("url") or "", quote=True)
+            items.append(
+                "<li>\n"
+                f"<h3>{html.escape(item.get('title') or '')}</h3>\n"
+                f"<p>{html.escape(item.get('summary') or '')}</p>\n"
+                f'<p><a href="{url}">Read more</a></p>\n'
+                "</li>"
+            )
+
+        return (
+            "<h2>From MyNewsRobot:</h2>\n"
+            f"<p>{html.escape(introduction)}</p>\n"
+            "<ol>\n" + "\n".join(items) + "\n</ol>\n"
+            f"<p>{html.escape(conclusion)}</p>\n"
+        )
+
     @staticmethod
     def get_writing_style() -> Dict[str, Any]:
         """
@@ -117,6 +221,7 @@ class ContentWritingAgent:
         Returns:
             Writing style guidelines
         """
+        # Already memoized by config_loader and refreshed when the file changes
         return config_loader.get_writing_style()
 
     @staticmethod
@@ -127,4 +232,10 @@ class ContentWritingAgent:
         Returns:
             Formatted date string (e.g., "November 30th, 2025")
         """
-        return format_newsletter_date()
+        return ContentWritingAgent._format_date_for(datetime.now().date())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _format_date_for(day: date) -> str:
+        """Format the newsletter date once per calendar day."""
+        return format_newsletter_date(datetime.combine(day, time()))
@@ -14,6 +14,7 @@ import logging
 from typing import Any, Dict
 
 from google.adk import Agent
+from google.genai import types
 
 from ..tools import publish_to_wordpress
 from ..utils.config_loader import config_loader
@@ -25,17 +26,14 @@ AGENT_NAME = "PublishingAgent"
 AGENT_MODEL = "gemini-2.5-flash"  # Updated to higher quota model
 AGENT_DESCRIPTION = "Publishes newsletter content to WordPress as a private post"
 AGENT_OUTPUT_KEY = "publication_result"  # Final result with post URL
+AGENT_TIMEOUT_MS = 60_000  # Per-request cap on Gemini calls
 
 AGENT_INSTRUCTION = """
-You are a publishing agent. Your ONLY job is to call the publish_to_wordpress tool.
+You are a publishing agent. Your only job is to call the publish_to_wordpress tool.
 
-When you receive a request:
-1. Extract the title, content, status, categories, and excerpt from the user's message
-2. IMMEDIATELY call the publish_to_wordpress tool with those parameters
-3. Do NOT provide any text response until AFTER you've called the tool
-4. After the tool returns results, share the post_url and edit_url from the response
-
-CRITICAL: You MUST call publish_to_wordpress. Do not explain, do not summarize - just call the tool first.
+1. Take title, content, status (normally "private"), categories (normally ["WeeklySummary"]) and excerpt from the request.
+2. Call publish_to_wordpress immediately - no text before the tool call.
+3. After it returns, reply with the post_url and edit_url from the result.
 """
 
 
@@ -58,6 +56,11 @@ class PublishingAgent:
             instruction=AGENT_INSTRUCTION,
             tools=[publish_to_wordpress],
             output_key=AGENT_OUTPUT_KEY,  # Final output
+            generate_content_config=types.GenerateContentConfig(
+                http_options=types.HttpOptions(timeout=AGENT_TIMEOUT_MS),
+                # Forwarding arguments to a tool needs no reasoning pass
+                thinking_config=types.ThinkingConfig(thinking_budget=0),
+            ),
         )
 
         logger.info(f"Created {AGENT_NAME} with model {AGENT_MODEL}")
@@ -4,64 +4,262 @@ MyNewsRobot - Main Application Entry Point
 This module initializes and runs the weekly news summary workflow.
 """
 
+from __future__ import annotations
+
 import asyncio
+import functools
+import html
 import logging
 import os
+import re
 import sys
-import subprocess
+from contextlib import asynccontextmanager
 
 from datetime import datetime
 from pathlib import Path
-import json
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
+import orjson
+from anyio import to_thread
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
-from google.genai import types
-from google.adk import Runner
-from google.adk.apps import App
-from google.adk.artifacts import InMemoryArtifactService
-from google.adk.memory import InMemoryMemoryService
-from google.adk.sessions import InMemorySessionService
-from google.adk import Agent
 
 # Add project root to path for imports
 project_root = str(Path(__file__).parent.parent)
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+from src.utils import date_formatter
 from src.utils.config_loader import config_loader
-from src.agents.content_analysis_agent import ContentAnalysisAgent
-from src.agents.content_writing_agent import ContentWritingAgent
-from src.agents.publishing_agent import PublishingAgent
+from src.utils.memory_manager import memory_manager
 
-app = FastAPI()
+# google-genai/ADK, the agents and the scraper take about a second to import,
+# so they are loaded on the first /run instead of delaying /health at startup
+if TYPE_CHECKING:
+    import aiohttp
+    from google.adk import Runner
+    from google.genai import types
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Threads available to sync routes, which Starlette runs through anyio's
+# threadpool (default 40 - slow YAML/WordPress calls can exhaust it)
+ANYIO_THREADPOOL_SIZE = int(os.getenv("ANYIO_THREADPOOL_SIZE", "200"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Size the shared threadpool and close the shared HTTP session on shutdown."""
+    to_thread.current_default_thread_limiter().total_tokens = ANYIO_THREADPOOL_SIZE
+    logger.info(f"anyio threadpool size set to {ANYIO_THREADPOOL_SIZE}")
+
+    app.state.http_session = None
+    try:
+        yield
+    finally:
+        if app.state.http_session is not None:
+            await app.state.http_session.close()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+def _get_http_session() -> Optional[aiohttp.ClientSession]:
+    """
+    Return the pooled feed session shared by every /run, opening it on first use.
+
+    Returns:
+        Shared client session, or None outside the server lifespan (discovery
+        then uses a temporary session)
+    """
+    if not hasattr(app.state, "http_session"):
+        return None
+    if app.state.http_session is None:
+        from src.news_scraper import create_http_session
+        app.state.http_session = create_http_session()
+    return app.state.http_session
+
+# Precompiled patterns used on every /run
+_P_FIRST_PARA = re.compile(r'<p[^>]*>(.+?)</p>', re.IGNORECASE | re.DOTALL)
+_P_STRIP_TAGS = re.compile(r'<[^>]+>')
+
+
+def _plain_text(markup: Optional[str]) -> str:
+    """Reduce an RSS excerpt to plain text: drop tags, then decode entities."""
+    return html.unescape(_P_STRIP_TAGS.sub('', markup or "")).strip()
+
+
+def _prompt_json(data) -> str:
+    """Serialize prompt data compactly; indent only when DEBUG logging is on."""
+    option = orjson.OPT_INDENT_2 if logger.isEnabledFor(logging.DEBUG) else 0
+    return orjson.dumps(data, option=option).decode()
+
 # Load environment variables
 load_dotenv()
 
-# Create the content analysis agent as the root agent for the app
-content_analysis_agent = ContentAnalysisAgent.create_agent()
-
-# Initialize Google GenAI App with the ContentAnalysisAgent
-app_instance = App(
-    name="MyNewsRobotApp",
-    root_agent=content_analysis_agent,
-    resumability_config=None
-)
-
-# Initialize Google GenAI Runner and session service
-session_service = InMemorySessionService()
-runner = Runner(
-    app=app_instance,
-    session_service=session_service,
-    artifact_service=InMemoryArtifactService(),
-    memory_service=InMemoryMemoryService()
-)
+# ADK app names for the analysis fallback and the newsletter writing agents
+ANALYSIS_APP_NAME = "MyNewsRobotApp"
+SUMMARY_APP_NAME = "ArticleSummaryApp"
+INTRO_APP_NAME = "NewsletterIntroApp"
+
+
+@functools.cache
+def _get_services() -> tuple:
+    """Create the session, artifact and memory services shared by all runners."""
+    from google.adk.artifacts import InMemoryArtifactService
+    from google.adk.memory import InMemoryMemoryService
+    from google.adk.sessions import InMemorySessionService
+
+    return InMemorySessionService(), InMemoryArtifactService(), InMemoryMemoryService()
+
+
+@functools.cache
+def _get_runner(app_name: str) -> Runner:
+    """
+    Build the Runner for an app on first use and reuse it afterwards.
+
+    Args:
+        app_name: ANALYSIS_APP_NAME, SUMMARY_APP_NAME or INTRO_APP_NAME
+
+    Returns:
+        Runner bound to the app's agent and the shared services
+    """
+    from google.adk import Runner
+    from google.adk.agents.context_cache_config import ContextCacheConfig
+    from google.adk.apps import App
+    from src.agents import ContentAnalysisAgent, ContentWritingAgent
+
+    if app_name == ANALYSIS_APP_NAME:
+        # The analysis run is multi-turn (tool call, then answer) over a large,
+        # stable prefix (instruction + article list), so let Gemini reuse it
+        # from context cache
+        app_instance = App(
+            name=app_name,
+            root_agent=ContentAnalysisAgent.create_agent(),
+            resumability_config=None,
+            context_cache_config=ContextCacheConfig(min_tokens=2048, ttl_seconds=3600),
+        )
+    elif app_name == SUMMARY_APP_NAME:
+        app_instance = App(
+            name=app_name,
+            root_agent=ContentWritingAgent.create_summary_agent(),
+            resumability_config=None,
+        )
+    elif app_name == INTRO_APP_NAME:
+        app_instance = App(
+            name=app_name,
+            root_agent=ContentWritingAgent.create_intro_agent(),
+            resumability_config=None,
+        )
+    else:
+        raise ValueError(f"Unknown app name: {app_name}")
+
+    session_service, artifact_service, memory_service = _get_services()
+    return Runner(
+        app=app_instance,
+        session_service=session_service,
+        artifact_service=artifact_service,
+        memory_service=memory_service
+    )
+
+
+# Per-stage cap on agent runs (seconds) and retry policy for timed-out stages
+STAGE_TIMEOUT = 300
+STAGE_MAX_ATTEMPTS = 3
+STAGE_RETRY_BASE_DELAY = 2
+
+
+async def _collect_agent_response(
+    agent_runner: Runner, session_id: str, message: types.Content, label: str
+) -> Tuple[str, int]:
+    """
+    Run an agent to completion and collect its text output.
+
+    Args:
+        agent_runner: Runner bound to the agent's app
+        session_id: Session to run in
+        message: User message to send
+        label: Short label used in log lines
+
+    Returns:
+        Tuple of (response_text, tool_calls_count)
+    """
+    # Collect chunks and join once - repeated str += is quadratic in output size
+    text_parts = []
+    tool_calls_count = 0
+
+    async for event in agent_runner.run_async(
+        user_id="default_user",
+        session_id=session_id,
+        new_message=message
+    ):
+        # Log tool calls
+        if hasattr(event, 'tool_call') and event.tool_call:
+            tool_calls_count += 1
+            logger.info(f"🔧 Tool call #{tool_calls_count}: {event.tool_call.name if hasattr(event.tool_call, 'name') else 'unknown'}")
+
+        if event.content and event.content.parts:
+            for part in event.content.parts:
+                if part.text:
+                    # Lazy %-formatting: skipped entirely unless DEBUG is on
+                    logger.debug("📝 %s chunk (%d chars)", label, len(part.text))
+                    text_parts.append(part.text)
+
+    return "".join(text_parts), tool_calls_count
+
+
+async def run_agent_with_timeout(
+    app_name: str,
+    prompt: str,
+    label: str,
+    max_attempts: int = STAGE_MAX_ATTEMPTS,
+) -> Tuple[str, int]:
+    """
+    Run an agent with a bounded wall time, retrying with backoff on timeout.
+
+    Each attempt gets a fresh session so a timed-out run leaves no partial
+    history behind.
+
+    Args:
+        app_name: App whose runner should handle the prompt
+        prompt: User message text to send
+        label: Short label used in log lines
+        max_attempts: Number of attempts before giving up
+
+    Returns:
+        Tuple of (response_text, tool_calls_count)
+
+    Raises:
+        asyncio.TimeoutError: If every attempt exceeds STAGE_TIMEOUT
+    """
+    from google.genai import types
+
+    agent_runner = _get_runner(app_name)
+    message = types.Content(role='user', parts=[types.Part(text=prompt)])
+    for attempt in range(1, max_attempts + 1):
+        session = await agent_runner.session_service.create_session(
+            app_name=app_name,
+            user_id="default_user"
+        )
+        try:
+            return await asyncio.wait_for(
+                _collect_agent_response(agent_runner, session.id, message, label),
+                timeout=STAGE_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            if attempt == max_attempts:
+                logger.error(f"❌ {label} timed out after {max_attempts} attempts")
+                raise
+            delay = STAGE_RETRY_BASE_DELAY ** attempt
+            logger.warning(
+                f"⚠️ {label} timed out after {STAGE_TIMEOUT}s "
+                f"(attempt {attempt}/{max_attempts}), retrying in {delay}s"
+            )
+            await asyncio.sleep(delay)
+
 
 # Define request and response models
 class RunRequest(BaseModel):
@@ -85,20 +283,6 @@ def format_newsletter_date(date: datetime = None) -> str:
     return date.strftime("%Y-%m-%d")
 
 
-# Function to run the news scraper script
-def run_news_scraper():
-    logger.info("📰 Step 1: Discovering articles from RSS feeds...")
-    scraper_path = Path(__file__).parent / "news_scraper.py"
-    if not scraper_path.exists():
-        raise RuntimeError("news_scraper.py not found. Ensure the script is in the same directory.")
-
-    # Set the working directory explicitly to ensure the scraper runs in the correct context
-    result = subprocess.run(["python", str(scraper_path)], cwd=Path(__file__).parent, capture_output=True, text=True)
-    if result.returncode != 0:
-        raise RuntimeError(f"news_scraper.py failed: {result.stderr}")
-
-    logger.info("✅ News scraper executed successfully.")
-
 # Function to analyze articles using the content analysis agent
 async def analyze_articles(articles):
     """
@@ -110,9 +294,28 @@ async def analyze_articles(articles):
     Returns:
         List of top 20 analyzed articles with priority scores
     """
+    from src.agents.content_analysis_agent import (
+        BOOKMARK_TOPIC,
+        UNMATCHED_TOPIC,
+        ContentAnalysisAgent,
+    )
+
     logger.info("🔍 Step 2: Analyzing articles and selecting top 20 by topic priorities...")
-    # Prepare the prompt with articles data
-    articles_json = json.dumps(articles, indent=2)
+
+    # Keyword scoring is deterministic, so do it locally and only fall back to
+    # the LLM when no article matches any configured topic
+    selected_articles = ContentAnalysisAgent.select_articles(articles)
+    if any(
+        article["matched_topic"] not in (BOOKMARK_TOPIC, UNMATCHED_TOPIC)
+        for article in selected_articles
+    ):
+        logger.info(f"✅ Selected {len(selected_articles)} articles by local keyword scoring")
+        return selected_articles
+    logger.info("No topic keyword matches found, falling back to ContentAnalysisAgent")
+
+    # Prepare the prompt with only the fields the agent ranks on; it answers
+    # with indices that are mapped back onto the full articles
+    articles_json = _prompt_json(ContentAnalysisAgent.compact_articles(articles))
     prompt = f"""
 Analyze the following {len(articles)} articles and select the top 20 based on topic priorities.
 
@@ -124,153 +327,148 @@ Remember to:
 2. Match each article against the topic keywords
 3. Assign priority scores (7-11) based on topic relevance
 4. Select the top 20 highest-priority articles
-5. Return the selected articles with their priority scores and matched topics
+5. Return the index (i) of each selected article with its priority score and matched topic
 """
     
-    # Create a session for this analysis
-    session = await session_service.create_session(
-        app_name="MyNewsRobotApp",
-        user_id="default_user",
-        session_id=f"content_analysis_{datetime.now().timestamp()}"
-    )
-    
-    message = types.Content(role='user', parts=[types.Part(text=prompt)])
-    
-    analyzed_articles = []
-    response_text = ""
-    tool_calls_count = 0
-    
     logger.info("🤖 Starting agent execution...")
-    async for event in runner.run_async(
-        user_id="default_user",
-        session_id=session.id,
-        new_message=message
-    ):
-        # Log tool calls
-        if hasattr(event, 'tool_call') and event.tool_call:
-            tool_calls_count += 1
-            logger.info(f"🔧 Tool call #{tool_calls_count}: {event.tool_call.name if hasattr(event.tool_call, 'name') else 'unknown'}")
-        
-        if event.content and event.content.parts:
-            for part in event.content.parts:
-                if part.text:
-                    # Log the agent's response
-                    logger.info(f"📝 Agent response chunk ({len(part.text)} chars)")
-                    response_text += part.text
+    response_text, tool_calls_count = await run_agent_with_timeout(
+        ANALYSIS_APP_NAME, prompt, "Agent response"
+    )
     
     logger.info(f"✅ Agent execution complete. Total response: {len(response_text)} chars, {tool_calls_count} tool calls")
     
-    # Parse the agent's response to extract the selected articles
-    # The agent should return JSON with the selected articles
+    # The agent's output_schema constrains the answer to a JSON array of
+    # selections, so it parses directly
     try:
-        # Try to find JSON in the response
-        import re
-        # Look for JSON array in the response
-        json_match = re.search(r'\[[\s\S]*\]', response_text)
-        if json_match:
-            logger.info(f"📊 Found JSON in response ({len(json_match.group())} chars), parsing...")
-            selected_articles_data = json.loads(json_match.group())
-            logger.info(f"✅ Successfully parsed {len(selected_articles_data)} articles from agent response")
-            analyzed_articles = selected_articles_data
-        else:
-            # Fallback: if no JSON found, use first 20 articles
-            logger.warning("⚠️ Could not find JSON array in agent response")
-            logger.warning(f"Response preview: {response_text[:500]}...")
-            logger.warning("Using first 20 articles as fallback")
-            analyzed_articles = articles[:20]
-    except Exception as e:
+        selections = orjson.loads(response_text)
+    except orjson.JSONDecodeError as e:
         logger.error(f"❌ Error parsing agent response: {e}")
         logger.error(f"Response preview: {response_text[:500]}...")
         logger.warning("Using first 20 articles as fallback")
-        analyzed_articles = articles[:20]
+        return articles[:20]
+
+    analyzed_articles = ContentAnalysisAgent.expand_selections(articles, selections)
+    logger.info(f"✅ Successfully parsed {len(analyzed_articles)} articles from agent response")
     
     return analyzed_articles
 
 
-async def write_newsletter(articles: list) -> str:
+async def write_newsletter(articles: list, newsletter_date: Optional[str] = None) -> str:
     """
-    Generate newsletter content using ContentWritingAgent.
+    Generate newsletter content using the ContentWritingAgent family.
+    
+    Article summaries are written in parallel batches of SUMMARY_BATCH_SIZE
+    while a separate short call writes the intro and conclusion; the HTML is
+    then assembled locally. Output length dominates LLM latency, so this
+    bounds the stage by the slowest batch instead of one 20-summary answer.
     
     Args:
         articles: List of analyzed articles with metadata
+        newsletter_date: Formatted newsletter date. Computed if not given.
         
     Returns:
         Newsletter HTML content
     """
-    # Create a prompt for the writing agent
-    newsletter_date = ContentWritingAgent.get_newsletter_date()
+    from src.agents.content_analysis_agent import PROMPT_EXCERPT_CHARS
+    from src.agents.content_writing_agent import ContentWritingAgent, SUMMARY_BATCH_SIZE
+
+    if newsletter_date is None:
+        newsletter_date = ContentWritingAgent.get_newsletter_date()
     writing_style = ContentWritingAgent.get_writing_style()
-    
-    prompt = f"""
-    Write a weekly newsletter for the date: {newsletter_date}
-    
-    Here are the {len(articles)} selected articles to include:
-    
-    {json.dumps(articles, indent=2)}
+    style_json = _prompt_json(writing_style)
+
+    async def summarize_batch(batch: list) -> list:
+        # Only the fields the summaries are written from, with markup removed
+        batch_input = [
+            {
+                "url": article.get("url"),
+                "title": article.get("title"),
+                "excerpt": _plain_text(article.get("excerpt")),
+            }
+            for article in batch
+        ]
+        prompt = f"""
+    Summarize these {len(batch)} articles for the weekly newsletter dated {newsletter_date}:
+    
+    {_prompt_json(batch_input)}
     
     Writing Style Guidelines:
-    {json.dumps(writing_style, indent=2)}
-    
-    Create a complete newsletter with:
-    1. Title: "Mark's Weekly Update: {newsletter_date}"
-    2. Introduction paragraph (150-200 words)
-    3. All {len(articles)} articles with summaries (~150 words each)
-    4. Brief conclusion
-    
-    Format as clean HTML ready for WordPress.
+    {style_json}
     """
+        response_text, _ = await run_agent_with_timeout(
+            SUMMARY_APP_NAME, prompt, "Article summaries"
+        )
+        try:
+            return orjson.loads(response_text)
+        except orjson.JSONDecodeError:
+            logger.warning(f"⚠️ Could not parse summary batch, using RSS excerpts. Preview: {response_text[:200]}...")
+            return []
+    
+    async def write_intro() -> dict:
+        headlines = [
+            {
+                "title": article.get("title"),
+                "excerpt": _plain_text(article.get("excerpt"))[:PROMPT_EXCERPT_CHARS],
+            }
+            for article in articles
+        ]
+        prompt = f"""
+    Write the introduction and conclusion for the weekly newsletter dated {newsletter_date}.
+    
+    This week's {len(articles)} articles:
+    {_prompt_json(headlines)}
     
-    # Create the writing agent
-    writing_agent = ContentWritingAgent.create_agent()
-    writing_app = App(
-        name="NewsletterWritingApp",
-        root_agent=writing_agent,
-        resumability_config=None
-    )
-    writing_runner = Runner(
-        app=writing_app,
-        session_service=session_service,
-        artifact_service=InMemoryArtifactService(),
-        memory_service=InMemoryMemoryService()
-    )
-    
-    # Create session for writing agent
-    session = await session_service.create_session(
-        app_name="NewsletterWritingApp",
-        user_id="default_user"
+    Writing Style Guidelines:
+    {style_json}
+    """
+        response_text, _ = await run_agent_with_timeout(
+            INTRO_APP_NAME, prompt, "Newsletter intro"
+        )
+        try:
+            return orjson.loads(response_text)
+        except orjson.JSONDecodeError:
+            logger.warning(f"⚠️ Could not parse newsletter intro. Preview: {response_text[:200]}...")
+            return {}
+    
+    batches = [
+        articles[i:i + SUMMARY_BATCH_SIZE]
+        for i in range(0, len(articles), SUMMARY_BATCH_SIZE)
+    ]
+    
+    logger.info(f"📝 Starting newsletter writing ({len(batches)} summary batches in parallel)...")
+    intro, *batch_results = await asyncio.gather(
+        write_intro(),
+        *(summarize_batch(batch) for batch in batches),
     )
-    message = types.Content(role='user', parts=[types.Part(text=prompt)])
-    
-    newsletter_content = ""
-    response_text = ""
-    tool_calls_count = 0
     
-    logger.info("📝 Starting newsletter writing...")
-    async for event in writing_runner.run_async(
-        user_id="default_user",
-        session_id=session.id,
-        new_message=message
-    ):
-        # Log tool calls
-        if hasattr(event, 'tool_call') and event.tool_call:
-            tool_calls_count += 1
-            logger.info(f"🔧 Tool call #{tool_calls_count}: {event.tool_call.name if hasattr(event.tool_call, 'name') else 'unknown'}")
-        
-        if event.content and event.content.parts:
-            for part in event.content.parts:
-                if part.text:
-                    logger.info(f"📝 Newsletter content chunk ({len(part.text)} chars)")
-                    response_text += part.text
+    # Keep the analysis order; fall back to the RSS excerpt for any article
+    # whose summary is missing from a batch response
+    written = {
+        item["url"]: item.get("summary")
+        for batch in batch_results
+        for item in batch
+        if isinstance(item, dict) and item.get("url")
+    }
+    summaries = [
+        {
+            "url": article.get("url"),
+            "title": article.get("title"),
+            "summary": written.get(article.get("url")) or _plain_text(article.get("excerpt")),
+        }
+        for article in articles
+    ]
     
-    logger.info(f"✅ Newsletter writing complete. Total: {len(response_text)} chars, {tool_calls_count} tool calls")
+    newsletter_content = ContentWritingAgent.render_newsletter(
+        intro.get("introduction") or f"This week's {len(articles)} picks from around the web.",
+        summaries,
+        intro.get("conclusion") or "",
+    )
     
-    # The response should be the newsletter HTML
-    newsletter_content = response_text
+    logger.info(f"✅ Newsletter writing complete. Total: {len(newsletter_content)} chars, {len(written)}/{len(articles)} summaries written")
     
-    # Save newsletter to file for debugging
+    # Save newsletter to file for debugging (off the event loop)
     newsletter_output_path = Path(__file__).parent / "newsletter_draft.html"
-    with open(newsletter_output_path, "w", encoding="utf-8") as f:
-        f.write(newsletter_content)
+    await asyncio.to_thread(newsletter_output_path.write_text, newsletter_content, encoding="utf-8")
     
     logger.info(f"💾 Newsletter saved to: {newsletter_output_path}")
     
@@ -279,7 +477,7 @@ async def write_newsletter(articles: list) -> str:
 
 async def publish_newsletter(newsletter_html: str, newsletter_date: str) -> Dict:
     """
-    Publish newsletter to WordPress using PublishingAgent.
+    Publish newsletter to WordPress by calling publish_to_wordpress directly.
     
     Args:
         newsletter_html: Complete newsletter HTML content
@@ -288,141 +486,91 @@ async def publish_newsletter(newsletter_html: str, newsletter_date: str) -> Dict
     Returns:
         Publication result with URLs
     """
-    # Extract title and excerpt from HTML (simple parsing)
-    import re
-    
+    from src.tools import publish_to_wordpress
+
     # Use formatted date for the title
-    from src.utils.date_formatter import format_newsletter_date
-    formatted_date = format_newsletter_date() if newsletter_date == "string" else newsletter_date
+    formatted_date = date_formatter.format_newsletter_date() if newsletter_date == "string" else newsletter_date
     title = f"Mark's Weekly Update: {formatted_date}"
     
     # Extract first paragraph as excerpt
-    excerpt_match = re.search(r'<p[^>]*>(.+?)</p>', newsletter_html, re.IGNORECASE)
+    excerpt_match = _P_FIRST_PARA.search(newsletter_html)
     if excerpt_match:
         excerpt = excerpt_match.group(1)
-        excerpt = re.sub(r'<[^>]+>', '', excerpt).strip()[:200]  # Remove tags, limit length
+        excerpt = _P_STRIP_TAGS.sub('', excerpt).strip()[:200]  # Remove tags, limit length
     else:
         excerpt = f"Weekly newsletter for {formatted_date}"
     
-    prompt = f"""
-    YOU MUST call the publish_to_wordpress tool to publish this newsletter to WordPress.
-    
-    Call publish_to_wordpress with these exact parameters:
-    
-    title: {title}
-    content: {newsletter_html}
-    status: private
-    categories: ["WeeklySummary"]
-    excerpt: {excerpt}
-    
-    Do NOT respond with text. ONLY call the publish_to_wordpress tool.
-    """
-    
-    # Create the publishing agent
-    publishing_agent = PublishingAgent.create_agent()
-    publishing_app = App(
-        name="NewsletterPublishingApp",
-        root_agent=publishing_agent,
-        resumability_config=None
-    )
-    publishing_runner = Runner(
-        app=publishing_app,
-        session_service=session_service,
-        artifact_service=InMemoryArtifactService(),
-        memory_service=InMemoryMemoryService()
-    )
-    
-    # Create session for publishing agent
-    session = await session_service.create_session(
-        app_name="NewsletterPublishingApp",
-        user_id="default_user"
-    )
-    message = types.Content(role='user', parts=[types.Part(text=prompt)])
-    
-    publication_result = {}
-    response_text = ""
-    tool_calls_count = 0
-    
+    # Publishing is a single deterministic tool call, so invoke the tool
+    # directly instead of paying for a Gemini round trip to choose it.
+    # PublishingAgent remains available for interactive/debug use.
     logger.info("🚀 Starting newsletter publishing...")
-    async for event in publishing_runner.run_async(
-        user_id="default_user",
-        session_id=session.id,
-        new_message=message
-    ):
-        # Log tool calls
-        if hasattr(event, 'tool_call') and event.tool_call:
-            tool_calls_count += 1
-            logger.info(f"🔧 Tool call #{tool_calls_count}: {event.tool_call.name if hasattr(event.tool_call, 'name') else 'unknown'}")
-        
-        if event.content and event.content.parts:
-            for part in event.content.parts:
-                if part.text:
-                    logger.info(f"📤 Publishing response chunk ({len(part.text)} chars)")
-                    response_text += part.text
-    
-    logger.info(f"✅ Newsletter publishing complete. Total: {len(response_text)} chars, {tool_calls_count} tool calls")
-    
-    # Try to extract URLs from response
-    post_url = None
-    edit_url = None
+    result = await asyncio.to_thread(
+        publish_to_wordpress,
+        title=title,
+        content=newsletter_html,
+        status="private",
+        categories=["WeeklySummary"],
+        excerpt=excerpt,
+    )
     
-    # Look for URLs in the response
-    url_pattern = r'https?://[^\s<>"]+'
-    urls = re.findall(url_pattern, response_text)
-    if urls:
-        for url in urls:
-            if 'wp-admin' in url or 'action=edit' in url:
-                edit_url = url
-            elif not post_url:
-                post_url = url
+    if not result.get("success"):
+        logger.error(f"❌ WordPress publish failed: {result.get('error')}")
     
     publication_result = {
-        "success": bool(post_url or edit_url),
-        "post_url": post_url,
-        "edit_url": edit_url,
-        "response": response_text,
-        "tool_calls": tool_calls_count
+        "success": bool(result.get("success")),
+        "post_url": result.get("post_url"),
+        "edit_url": result.get("edit_url"),
+        "response": result,
+        "tool_calls": 1
     }
     
     return publication_result
 
 async def run_workflow(request: RunRequest):
-    start_time = datetime.now()
+    from src.agents.content_writing_agent import ContentWritingAgent
+    from src.news_scraper import discover_articles
 
-    # Step 1: Run the news scraper
-    run_news_scraper()
+    start_time = datetime.now()
 
-    # Step 2: Load discovered articles from JSON
-    discovered_articles_path = Path(__file__).parent / "discovered_articles.json"
-    if not discovered_articles_path.exists():
-        raise RuntimeError("discovered_articles.json not found. Run news_scraper.py first.")
+    # Resolve the newsletter date once and share it with every stage
+    newsletter_date = request.newsletter_date
+    if newsletter_date == "string":
+        newsletter_date = ContentWritingAgent.get_newsletter_date()
 
-    with open(discovered_articles_path, "r", encoding="utf-8") as f:
-        discovered_articles = json.load(f)
+    # Step 1: Discover articles in-process, warming the configs later stages
+    # need while the feeds are fetched
+    logger.info("📰 Step 1: Discovering articles from RSS feeds...")
+    discovered_articles, _, _ = await asyncio.gather(
+        discover_articles(_get_http_session()),
+        asyncio.to_thread(config_loader.get_topic_priorities),
+        asyncio.to_thread(ContentWritingAgent.get_writing_style),
+    )
 
-    logger.info(f"Loaded {len(discovered_articles)} articles from discovered_articles.json")
+    logger.info(f"✅ Discovered {len(discovered_articles)} articles")
 
     # Step 3: Analyze articles using ContentAnalysisAgent
     analyzed_articles = await analyze_articles(discovered_articles)
 
-    # Step 4: Save analysis results to JSON
+    # Step 4: Save analysis results to JSON (off the event loop)
     analysis_output_path = Path(__file__).parent / "analyzed_articles.json"
-    with open(analysis_output_path, "w", encoding="utf-8") as f:
-        json.dump(analyzed_articles, f, indent=4)
+    await asyncio.to_thread(
+        analysis_output_path.write_bytes,
+        orjson.dumps(analyzed_articles, option=orjson.OPT_INDENT_2),
+    )
 
     logger.info(f"✅ Analysis complete. Top {len(analyzed_articles)} articles selected and saved.")
 
     # Step 3: Generate newsletter content using ContentWritingAgent
     logger.info("✍️ Step 3: Writing newsletter summaries...")
-    newsletter_content = await write_newsletter(analyzed_articles)
+    newsletter_content = await write_newsletter(analyzed_articles, newsletter_date)
     logger.info(f"✅ Newsletter writing complete. {len(newsletter_content)} characters generated.")
     
-    # Step 4: Publish to WordPress using PublishingAgent
+    # Step 4: Publish to WordPress (direct publish_to_wordpress call)
     logger.info("🚀 Step 4: Publishing to WordPress...")
-    publication_result = await publish_newsletter(newsletter_content, request.newsletter_date)
+    publication_result = await publish_newsletter(newsletter_content, newsletter_date)
     
     if publication_result.get("success"):
-        logger.info(f"✅ Newsletter published successfully!")
+        logger.info("✅ Newsletter published successfully!")
         if publication_result.get("post_url"):
             logger.info(f"📍 Post URL: {publication_result['post_url']}")
         if publication_result.get("edit_url"):
@@ -453,14 +601,23 @@ async def run_endpoint(request: RunRequest):
     return response
 
 
+@app.get("/health")
+def health():
+    """Liveness check used by the container HEALTHCHECK."""
+    return {"status": "healthy"}
+
+
+# Plain def: the handler does blocking config/YAML work, so FastAPI runs it in
+# the threadpool instead of stalling the event loop
 @app.get("/config/status")
-async def config_status():
+def config_status():
     """Get configuration status and validation."""
     try:
-        news_sources = config_loader.get_news_sources()
-        topic_priorities = config_loader.get_topic_priorities()
-        bookmarks = config_loader.get_weekly_bookmarks()
-        gcp_config = config_loader.get_google_cloud_config()
+        cfg = config_loader.get_all()
+        news_sources = cfg["news_sources"]
+        topic_priorities = cfg["topic_priorities"]
+        bookmarks = cfg["weekly_bookmarks"]
+        gcp_config = cfg["google_cloud"]
 
         # Count sources - handle None values from YAML
         total_pages = sum(
@@ -501,7 +658,33 @@ def main():
     current_date = format_newsletter_date()
     logger.info(f"Current newsletter date: Mark's Weekly Update: {current_date}")
 
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    # Run the whole pipeline on uvloop when available (not on Windows)
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "h11"
+    logger.info(f"Using {loop} event loop with {http} HTTP parser")
+
+    # Multiple workers need an import string so each process can load the app
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    uvicorn.run(
+        "src.main:app" if workers > 1 else app,
+        host=host,
+        port=port,
+        log_level="info",
+        loop=loop,
+        http=http,
+        workers=workers,
+        limit_concurrency=1024,
+        backlog=2048,
+        timeout_keep_alive=5,
+    )
 
 
 if __name__ == "__main__":
@@ -1,34 +1,106 @@
 """
-news_scraper.py - Scrape all news sources and weekly bookmarks, output article metadata to JSON
+news_scraper.py - Scrape all news sources and weekly bookmarks for article metadata
 
-This script:
+This module:
 1. Loads news sources from config
 2. Loads weekly bookmarks
 3. Scrapes each news source for article metadata (not full content)
-4. Stores all discovered articles in discovered_articles.json for analysis
+4. Returns all discovered articles to the caller (the workflow runs it in-process)
+
+Run it directly with --debug to also dump the articles to discovered_articles.json.
 """
 
+import argparse
+import asyncio
 import logging
-import json
 import sys
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+import orjson
 
 # Add project root to path for imports
 project_root = str(Path(__file__).parent.parent)
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from src.tools import scrape_web_content, load_user_bookmarks
+from src.tools import load_user_bookmarks
+from src.tools.web_scraper_tool import USER_AGENT, parse_rss_content
 from src.utils.config_loader import config_loader
 from src.utils.memory_manager import memory_manager
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("news_scraper")
 
 OUTPUT_FILE = "discovered_articles.json"
 
-def main():
+# Maximum number of concurrent feed connections (overall and per host),
+# per-feed time budget and DNS cache lifetime (seconds)
+MAX_CONCURRENT_FETCHES = 50
+MAX_FETCHES_PER_HOST = 10
+FETCH_TIMEOUT = 30
+DNS_CACHE_TTL = 300
+
+
+async def _fetch_rss_source(session: aiohttp.ClientSession, source: Dict[str, Any]) -> Dict[str, Any]:
+    """Fetch one RSS source and parse it off the event loop."""
+    url = source["url"]
+    try:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            content = await response.read()
+        # feedparser is synchronous and CPU-bound - keep it off the loop
+        return await asyncio.to_thread(parse_rss_content, url, content)
+    except Exception as e:
+        logger.error(f"Error fetching {url}: {e}")
+        return {"success": False, "url": url, "error": str(e)}
+
+
+def create_http_session() -> aiohttp.ClientSession:
+    """
+    Create a pooled client session for feed fetches.
+
+    Callers that fetch repeatedly (the API server) should create one session
+    and pass it to discover_articles so connections and DNS lookups are reused.
+
+    Returns:
+        aiohttp.ClientSession; the caller is responsible for closing it
+    """
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONCURRENT_FETCHES,
+        limit_per_host=MAX_FETCHES_PER_HOST,
+        ttl_dns_cache=DNS_CACHE_TTL,
+    )
+    timeout = aiohttp.ClientTimeout(total=FETCH_TIMEOUT)
+    return aiohttp.ClientSession(
+        connector=connector, timeout=timeout, headers={"User-Agent": USER_AGENT}
+    )
+
+
+async def _fetch_rss_sources(
+    sources: List[Dict[str, Any]], session: Optional[aiohttp.ClientSession] = None
+) -> List[Dict[str, Any]]:
+    """Fetch all RSS sources concurrently over one pooled client session."""
+    if session is not None:
+        return await asyncio.gather(*(_fetch_rss_source(session, source) for source in sources))
+
+    async with create_http_session() as own_session:
+        return await asyncio.gather(*(_fetch_rss_source(own_session, source) for source in sources))
+
+
+async def discover_articles(
+    session: Optional[aiohttp.ClientSession] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Discover candidate articles from the configured RSS feeds and weekly bookmarks.
+
+    Args:
+        session: Shared client session to fetch with. A temporary one is
+            created (and closed) when not given.
+
+    Returns:
+        List of article metadata dicts, with already-processed URLs filtered out
+    """
     # Load news sources
     news_config = config_loader.get_news_sources()
     sources = []
@@ -43,27 +115,33 @@ def main():
             })
     logger.info(f"Loaded {len(sources)} news sources from config")
 
-    # Load weekly bookmarks
-    bookmarks_result = load_user_bookmarks()
-    bookmarks = bookmarks_result.get("bookmarks", [])
-    logger.info(f"Loaded {len(bookmarks)} weekly bookmarks")
-
     # Scrape each news source for metadata (RSS feeds only)
-    articles = []
+    rss_sources = []
     for source in sources:
         # Enforce RSS-only - skip if not RSS feed
         source_type = source["type"]
         if source_type not in ["rss", "auto"]:
             logger.warning(f"Skipping non-RSS source {source['url']} (type={source_type}). Only RSS feeds are supported.")
             continue
-            
-        # Force RSS mode - we only support RSS feeds now
-        result = scrape_web_content(
-            url=source["url"],
-            mode="rss",  # Always use RSS mode
-            extract_links=False,  # Don't extract links, RSS feeds provide entries directly
-            timeout=30
-        )
+        rss_sources.append(source)
+
+    # Fetch feeds concurrently - the work is I/O bound, so overlapping requests
+    # cuts wall time to roughly that of the slowest feed. Weekly bookmarks load
+    # alongside the feed fetches.
+    bookmarks_result, results = await asyncio.gather(
+        asyncio.to_thread(load_user_bookmarks),
+        _fetch_rss_sources(rss_sources, session),
+    )
+
+    bookmarks = bookmarks_result.get("bookmarks", [])
+    logger.info(f"Loaded {len(bookmarks)} weekly bookmarks")
+
+    # Snapshot processed URLs once; per-entry checks are then plain set lookups
+    processed_urls = memory_manager.get_processed_urls()
+    normalize_url = memory_manager.normalize_url
+
+    articles = []
+    for source, result in zip(rss_sources, results):
         if result.get("success"):
             result_type = result.get("type")
             if result_type != "rss":
@@ -82,7 +160,7 @@ def main():
                     "is_bookmark": False,
                 }
                 # Filter out processed URLs
-                if not memory_manager.is_processed(article["url"]):
+                if normalize_url(article["url"]) not in processed_urls:
                     articles.append(article)
         else:
             logger.warning(f"Failed to scrape RSS feed {source['url']}: {result.get('error')}")
@@ -100,11 +178,23 @@ def main():
         })
 
     logger.info(f"Discovered {len(articles)} articles (including bookmarks)")
+    return articles
+
+
+async def main(debug: bool = False):
+    articles = await discover_articles()
+
+    # Only persist the intermediate file when debugging
+    if debug:
+        with open(OUTPUT_FILE, "wb") as f:
+            f.write(orjson.dumps(articles, option=orjson.OPT_INDENT_2))
+        logger.info(f"Saved discovered articles to {OUTPUT_FILE}")
 
-    # Save to JSON
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(articles, f, ensure_ascii=False, indent=2)
-    logger.info(f"Saved discovered articles to {OUTPUT_FILE}")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Discover articles from news sources and bookmarks")
+    parser.add_argument("--debug", action="store_true", help=f"Write discovered articles to {OUTPUT_FILE}")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(debug=args.debug))
@@ -5,13 +5,148 @@ Supports loading from local YAML files or Google Cloud Storage.
 Bookmarks always get highest priority (11) in article selection.
 """
 
+import functools
 import logging
-from typing import Any, Dict, List
+import os
+from typing import Any, Dict, List, Tuple
 
 import yaml
 
+# Prefer the libyaml-backed loader; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
+# Validated bookmark results by source path -> (version, result). The version
+# is (mtime_ns, size) for local files and (generation, size) for GCS objects.
+_BOOKMARK_CACHE: Dict[str, Tuple[Tuple[Any, Any], Dict[str, Any]]] = {}
+
+# Keys a validated bookmark carries
+_BOOKMARK_FIELDS = frozenset({"url", "note", "submitted_date", "priority"})
+
+
+# Lazily created google.cloud.storage.Client, reused across GCS loads
+_gcs_client = None
+
+
+def _get_gcs_client():
+    """Return the shared GCS client, creating (and authenticating) it on first use."""
+    global _gcs_client
+    if _gcs_client is None:
+        try:
+            from google.cloud import storage
+        except ImportError:
+            raise ImportError(
+                "google-cloud-storage is required for GCS support. "
+                "Install with: pip install google-cloud-storage"
+            )
+        _gcs_client = storage.Client()
+    return _gcs_client
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_gcs_path(gcs_path: str) -> Tuple[str, str]:
+    """
+    Split a gs:// path into bucket name and object path.
+
+    Args:
+        gcs_path: GCS path (gs://bucket/path/file.yaml)
+
+    Returns:
+        Tuple of (bucket_name, blob_path)
+
+    Raises:
+        ValueError: If the path is not a gs:// path
+    """
+    if not gcs_path.startswith("gs://"):
+        raise ValueError(f"Invalid GCS path: {gcs_path}")
+    bucket_name, _, blob_path = gcs_path[5:].partition("/")
+    return bucket_name, blob_path
+
+
+def _cached_result(path: str, version: Tuple[Any, Any]) -> Dict[str, Any]:
+    """Return a copy of the cached result for path if its version still matches."""
+    cached = _BOOKMARK_CACHE.get(path)
+    if cached is not None and cached[0] == version:
+        return _copy_result(cached[1])
+    return {}
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached result down to each bookmark so callers can't alter the cache."""
+    return {**result, "bookmarks": [dict(bookmark) for bookmark in result["bookmarks"]]}
+
+
+def _store_result(
+    source: str, version: Tuple[Any, Any], data: Dict[str, Any], origin: str
+) -> Dict[str, Any]:
+    """
+    Validate parsed bookmark data, cache the result and return a copy.
+
+    Args:
+        source: Path the data was loaded from (the cache key)
+        version: Source version the data was read at
+        data: Parsed YAML content
+        origin: Short description of the source for log lines
+
+    Returns:
+        Bookmark data
+    """
+    bookmarks = (data or {}).get("bookmarks") or []
+
+    # Fast path: freshly parsed entries that already have the canonical
+    # shape are completed in place instead of being copied
+    if isinstance(bookmarks, list) and all(
+        type(bookmark) is dict
+        and "url" in bookmark
+        and bookmark.keys() <= _BOOKMARK_FIELDS
+        for bookmark in bookmarks
+    ):
+        for bookmark in bookmarks:
+            bookmark.setdefault("note", "")
+            bookmark.setdefault("submitted_date", "")
+            bookmark["priority"] = 11  # Always highest priority
+        validated_bookmarks = bookmarks
+    else:
+        validated_bookmarks = _validate_bookmarks(bookmarks)
+
+    logger.info(f"Loaded {len(validated_bookmarks)} bookmarks from {origin}")
+
+    result = {
+        "success": True,
+        "bookmarks": validated_bookmarks,
+        "count": len(validated_bookmarks),
+        "source": source,
+    }
+    _BOOKMARK_CACHE[source] = (version, result)
+    return _copy_result(result)
+
+
+def _validate_bookmarks(bookmarks: Any) -> List[Dict[str, Any]]:
+    """Rebuild each usable bookmark in canonical form, skipping invalid entries."""
+    validated_bookmarks = []
+    for bookmark in bookmarks:
+        if not isinstance(bookmark, dict):
+            logger.warning(f"Invalid bookmark format: {bookmark}")
+            continue
+
+        if "url" not in bookmark:
+            logger.warning(f"Bookmark missing URL: {bookmark}")
+            continue
+
+        validated_bookmarks.append(
+            {
+                "url": bookmark["url"],
+                "note": bookmark.get("note", ""),
+                "submitted_date": bookmark.get("submitted_date", ""),
+                "priority": 11,  # Always highest priority
+            }
+        )
+    return validated_bookmarks
+
 
 def load_user_bookmarks(
     config_path: str = "config/weekly_bookmarks.yaml",
@@ -41,9 +176,9 @@ def load_user_bookmarks(
     try:
         # Check if GCS path
         if config_path.startswith("gs://"):
-            return _load_from_gcs(config_path)
+            return _load_from_gcs(config_path, refresh)
         else:
-            return _load_from_local(config_path)
+            return _load_from_local(config_path, refresh)
 
     except FileNotFoundError:
         logger.warning(f"Bookmark file not found: {config_path}")
@@ -65,107 +200,61 @@ def load_user_bookmarks(
         }
 
 
-def _load_from_local(file_path: str) -> Dict[str, Any]:
+def _load_from_local(file_path: str, refresh: bool = False) -> Dict[str, Any]:
         """
         Load bookmarks from local YAML file.
 
+        The parsed result is reused while the file's mtime and size are unchanged.
+
         Args:
             file_path: Local file path
+            refresh: Re-read the file even if it is unchanged
 
         Returns:
             Bookmark data
         """
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-
-        bookmarks = data.get("bookmarks") or []
+        stat = os.stat(file_path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        if not refresh:
+            cached = _cached_result(file_path, version)
+            if cached:
+                return cached
 
-        # Validate bookmark structure
-        validated_bookmarks = []
-        for bookmark in bookmarks:
-            if not isinstance(bookmark, dict):
-                logger.warning(f"Invalid bookmark format: {bookmark}")
-                continue
-
-            if "url" not in bookmark:
-                logger.warning(f"Bookmark missing URL: {bookmark}")
-                continue
-
-            validated_bookmarks.append(
-                {
-                    "url": bookmark["url"],
-                    "note": bookmark.get("note", ""),
-                    "submitted_date": bookmark.get("submitted_date", ""),
-                    "priority": 11,  # Always highest priority
-                }
-            )
+        with open(file_path, "rb") as f:
+            data = yaml.load(f, Loader=_YamlLoader)
 
-        logger.info(f"Loaded {len(validated_bookmarks)} bookmarks from local file")
-
-        return {
-            "success": True,
-            "bookmarks": validated_bookmarks,
-            "count": len(validated_bookmarks),
-            "source": file_path,
-        }
+        return _store_result(file_path, version, data, "local file")
 
 
-def _load_from_gcs(gcs_path: str) -> Dict[str, Any]:
+def _load_from_gcs(gcs_path: str, refresh: bool = False) -> Dict[str, Any]:
         """
         Load bookmarks from Google Cloud Storage.
 
+        Only object metadata is fetched while the object's generation is
+        unchanged; the content is downloaded when it changes.
+
         Args:
             gcs_path: GCS path (gs://bucket/path/file.yaml)
+            refresh: Download the object even if it is unchanged
 
         Returns:
             Bookmark data
         """
-        try:
-            from google.cloud import storage
-        except ImportError:
-            raise ImportError(
-                "google-cloud-storage is required for GCS support. "
-                "Install with: pip install google-cloud-storage"
-            )
-
-        # Parse GCS path
-        if not gcs_path.startswith("gs://"):
-            raise ValueError(f"Invalid GCS path: {gcs_path}")
-
-        path_parts = gcs_path[5:].split("/", 1)
-        bucket_name = path_parts[0]
-        blob_path = path_parts[1] if len(path_parts) > 1 else ""
+        bucket_name, blob_path = _parse_gcs_path(gcs_path)
 
         # Download from GCS
-        storage_client = storage.Client()
-        bucket = storage_client.bucket(bucket_name)
+        bucket = _get_gcs_client().bucket(bucket_name)
         blob = bucket.blob(blob_path)
 
-        content = blob.download_as_text()
-        data = yaml.safe_load(content)
+        blob.reload()  # Metadata only
+        version = (blob.generation, blob.size)
+        if not refresh:
+            cached = _cached_result(gcs_path, version)
+            if cached:
+                return cached
 
-        bookmarks = data.get("bookmarks") or []
+        # Raw bytes straight into the YAML parser (no separate text decode)
+        content = blob.download_as_bytes(if_generation_match=blob.generation)
+        data = yaml.load(content, Loader=_YamlLoader)
 
-        # Validate bookmark structure
-        validated_bookmarks = []
-        for bookmark in bookmarks:
-            if not isinstance(bookmark, dict) or "url" not in bookmark:
-                continue
-
-            validated_bookmarks.append(
-                {
-                    "url": bookmark["url"],
-                    "note": bookmark.get("note", ""),
-                    "submitted_date": bookmark.get("submitted_date", ""),
-                    "priority": 11,  # Always highest priority
-                }
-            )
-
-        logger.info(f"Loaded {len(validated_bookmarks)} bookmarks from GCS")
-
-        return {
-            "success": True,
-            "bookmarks": validated_bookmarks,
-            "count": len(validated_bookmarks),
-            "source": gcs_path,
-        }
+        return _store_result(gcs_path, version, data, "GCS")
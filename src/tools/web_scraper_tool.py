@@ -3,28 +3,68 @@ Web scraping tool - Fetch and extract article content from URLs
 
 Supports both RSS feeds and HTML pages. For RSS feeds, uses content tags
 when available to avoid fetching full HTML. For HTML pages, extracts
-article content using newspaper3k and BeautifulSoup4.
+article content using newspaper3k and links using lxml.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin, urlparse
+import re
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
 
-import feedparser
 import requests
-from bs4 import BeautifulSoup
-from newspaper import Article
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# feedparser and newspaper3k (which pulls in nltk, PIL and lxml) are
+# imported where they are used, so importing the tools package stays cheap
+if TYPE_CHECKING:
+    from lxml.html import HtmlElement
 
 logger = logging.getLogger(__name__)
 
-# Module-level session for reuse
+# Connection timeout (seconds) for all scraper requests; read timeout is per-call
+CONNECT_TIMEOUT = 3
+
+# Identify the bot to feed hosts (shared with async fetchers in news_scraper)
+USER_AGENT = "Mozilla/5.0 (compatible; MyNewsRobot/1.0; +https://mkfoster.com)"
+
+# Module-level session for reuse (keep-alive + per-host connection pooling)
 _session = requests.Session()
-_session.headers.update({
-    "User-Agent": (
-        "Mozilla/5.0 (compatible; MyNewsRobot/1.0; "
-        "+https://mkfoster.com)"
+_adapter = HTTPAdapter(
+    pool_connections=50,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+_session.headers.update({"User-Agent": USER_AGENT})
+
+# Substring checks as single precompiled alternations: one scan per string
+# instead of one Python-level `in` per pattern
+_RSS_URL_PATTERN = re.compile(
+    "|".join(map(re.escape, ["/feed", "/rss", "/atom", ".xml", "feed.xml", "rss.xml"]))
+)
+_RSS_CONTENT_TYPE_PATTERN = re.compile("xml|rss|atom|feed", re.IGNORECASE)
+# HEAD-probe results by full URL -> (expiry timestamp, 'rss' or 'html');
+# the query matters (WordPress serves its feed at /?feed=rss2)
+CONTENT_TYPE_CACHE_TTL = 3600
+CONTENT_TYPE_CACHE_SIZE = 1024
+_content_type_cache: Dict[str, Tuple[float, str]] = {}
+
+# <meta charset="..."> / http-equiv content="...; charset=..." in the page head
+META_CHARSET_SCAN_BYTES = 4096
+_META_CHARSET_PATTERN = re.compile(rb"""<meta[^>]+charset=["']?([\w.:-]+)""", re.IGNORECASE)
+
+_HTTP_PREFIXES = ("http://", "https://")
+_SKIP_LINK_PATTERN = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            ["#", "javascript:", "mailto:", "/tag/", "/category/", "/author/", "/page/"],
+        )
     )
-})
+)
 
 
 def scrape_web_content(
@@ -64,7 +104,7 @@ def scrape_web_content(
             logger.info(f"Auto-detected content type: {mode}")
 
         if mode == "rss":
-            return _parse_rss_feed(url)
+            return _parse_rss_feed(url, timeout)
         else:
             return _parse_html_page(url, extract_links, timeout)
 
@@ -88,47 +128,79 @@ def _detect_content_type(url: str) -> str:
             'rss' or 'html'
         """
         # Common RSS patterns
-        rss_indicators = [
-            "/feed",
-            "/rss",
-            "/atom",
-            ".xml",
-            "feed.xml",
-            "rss.xml",
-        ]
-
-        url_lower = url.lower()
-        if any(indicator in url_lower for indicator in rss_indicators):
+        if _RSS_URL_PATTERN.search(url.lower()):
             return "rss"
 
+        cached = _content_type_cache.get(url)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
         # Try a HEAD request to check Content-Type
         try:
-            response = _session.head(url, timeout=10, allow_redirects=True)
-            content_type = response.headers.get("Content-Type", "").lower()
-            if any(
-                rss_type in content_type
-                for rss_type in ["xml", "rss", "atom", "feed"]
-            ):
-                return "rss"
+            response = _session.head(
+                url, timeout=(CONNECT_TIMEOUT, 10), allow_redirects=True
+            )
         except Exception:
-            pass
+            return "html"
+
+        content_type = response.headers.get("Content-Type", "")
+        response.close()  # Hand the connection straight back to the pool
+        detected = "rss" if _RSS_CONTENT_TYPE_PATTERN.search(content_type) else "html"
+        _cache_content_type(url, detected)
+        return detected
 
-        return "html"
 
+def _cache_content_type(url: str, detected: str) -> None:
+    """Remember a probe result, keeping the cache within CONTENT_TYPE_CACHE_SIZE."""
+    now = time.monotonic()
+    if url not in _content_type_cache and len(_content_type_cache) >= CONTENT_TYPE_CACHE_SIZE:
+        # Drop expired entries first, then the oldest insertions
+        for key in [key for key, (expiry, _) in _content_type_cache.items() if expiry <= now]:
+            del _content_type_cache[key]
+        while len(_content_type_cache) >= CONTENT_TYPE_CACHE_SIZE:
+            del _content_type_cache[next(iter(_content_type_cache))]
+    _content_type_cache[url] = (now + CONTENT_TYPE_CACHE_TTL, detected)
 
-def _parse_rss_feed(url: str) -> Dict[str, Any]:
+
+def _parse_rss_feed(url: str, timeout: int = 30) -> Dict[str, Any]:
         """
         Parse an RSS/Atom feed.
 
         Args:
             url: RSS feed URL
+            timeout: Read timeout in seconds
 
         Returns:
             Feed data with entries
         """
         logger.info(f"Parsing RSS feed: {url}")
 
-        feed = feedparser.parse(url)
+        # Fetch through the pooled session so repeated feeds reuse connections
+        response = _session.get(url, timeout=(CONNECT_TIMEOUT, timeout))
+        response.raise_for_status()
+        return parse_rss_content(url, response.content)
+
+
+def parse_rss_content(url: str, content: bytes) -> Dict[str, Any]:
+        """
+        Parse already-downloaded RSS/Atom feed content.
+
+        Lets callers that fetch feeds themselves (e.g., asynchronously)
+        share the same entry extraction as scrape_web_content.
+
+        Args:
+            url: RSS feed URL (used for reporting)
+            content: Raw feed document
+
+        Returns:
+            Feed data with entries
+        """
+        import feedparser
+
+        # Keep feedparser's sanitizer: the regex tag-strip downstream would
+        # leave <script>/<style> bodies in excerpts. Relative URIs are never
+        # followed, so that pass over every entry body is skipped
+        feed = feedparser.parse(content, resolve_relative_uris=False)
 
         if feed.bozo:
             logger.warning(f"RSS feed has parsing errors: {feed.bozo_exception}")
@@ -138,39 +210,7 @@ def _parse_rss_feed(url: str) -> Dict[str, Any]:
         feed_description = feed.feed.get("description", "")
 
         # Extract entries
-        entries = []
-        for entry in feed.entries:
-            # Get content from various possible fields
-            content = None
-            summary = None
-
-            # Try content field first (often has full text)
-            if hasattr(entry, "content"):
-                content = entry.content[0].value
-            elif hasattr(entry, "description"):
-                content = entry.description
-
-            # Get summary
-            if hasattr(entry, "summary"):
-                summary = entry.summary
-
-            # Get published date
-            published = None
-            if hasattr(entry, "published"):
-                published = entry.published
-            elif hasattr(entry, "updated"):
-                published = entry.updated
-
-            entries.append(
-                {
-                    "title": entry.get("title", ""),
-                    "link": entry.get("link", ""),
-                    "content": content,
-                    "summary": summary,
-                    "author": entry.get("author", ""),
-                    "published_date": published,
-                }
-            )
+        entries = [_entry_fields(entry) for entry in feed.entries]
 
         return {
             "success": True,
@@ -183,6 +223,36 @@ def _parse_rss_feed(url: str) -> Dict[str, Any]:
         }
 
 
+def _entry_fields(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Pull the fields we use from one feedparser entry.
+
+        Uses dict lookups only: hasattr() on a FeedParserDict goes through
+        __getattr__ and raises internally for every missing key.
+
+        Args:
+            entry: feedparser entry
+
+        Returns:
+            Entry dict with title, link, content, summary, author, published_date
+        """
+        # Try content field first (often has full text)
+        content_list = entry.get("content")
+        if content_list:
+            content = content_list[0].get("value")
+        else:
+            content = entry.get("description")
+
+        return {
+            "title": entry.get("title", ""),
+            "link": entry.get("link", ""),
+            "content": content,
+            "summary": entry.get("summary"),
+            "author": entry.get("author", ""),
+            "published_date": entry.get("published") or entry.get("updated"),
+        }
+
+
 def _parse_html_page(
     url: str, extract_links: bool, timeout: int
 ) -> Dict[str, Any]:
@@ -199,9 +269,51 @@ def _parse_html_page(
         """
         logger.info(f"Parsing HTML page: {url}")
 
-        # Use newspaper3k for article extraction
+        # Fetch over the pooled session (newspaper's own download opens a new
+        # connection per URL), then let newspaper3k extract the article
+        response = _session.get(url, timeout=(CONNECT_TIMEOUT, timeout))
+        response.raise_for_status()
+        return _parse_article_html(url, _response_html(response), extract_links)
+
+
+def _response_html(response: requests.Response) -> str:
+    """
+    Decode an HTML response body.
+
+    Without a charset in Content-Type, requests falls back to ISO-8859-1 for
+    text/html, which turns UTF-8 pages into mojibake. Like newspaper3k's own
+    download, use the page's <meta charset> instead, or a detected encoding.
+
+    Args:
+        response: Fetched HTML page
+
+    Returns:
+        Page HTML as text
+    """
+    if "charset" not in response.headers.get("Content-Type", "").lower():
+        declared = _META_CHARSET_PATTERN.search(response.content[:META_CHARSET_SCAN_BYTES])
+        response.encoding = (
+            declared.group(1).decode("ascii") if declared else response.apparent_encoding
+        )
+    return response.text
+
+
+def _parse_article_html(url: str, html: str, extract_links: bool) -> Dict[str, Any]:
+        """
+        Extract article data from already-downloaded HTML.
+
+        Args:
+            url: Page URL
+            html: Page HTML
+            extract_links: Whether to extract article links
+
+        Returns:
+            Article data
+        """
+        from newspaper import Article
+
         article = Article(url)
-        article.download()
+        article.download(input_html=html)
         article.parse()
 
         result = {
@@ -219,54 +331,54 @@ def _parse_html_page(
             "images": list(article.images),
         }
 
-        # Extract links if requested
+        # Extract links if requested, reusing newspaper's lxml tree. clean_doc
+        # is its untouched copy of the page; article.doc has been pruned.
         if extract_links:
-            result["links"] = _extract_article_links(url, article.html)
+            result["links"] = _extract_article_links(url, article.clean_doc)
 
         return result
 
 
-def _extract_article_links(base_url: str, html: str) -> List[Dict[str, str]]:
+def _extract_article_links(base_url: str, doc: Optional["HtmlElement"]) -> List[Dict[str, str]]:
         """
-        Extract article links from HTML.
+        Extract article links from a parsed HTML document.
 
         Args:
             base_url: Base URL for resolving relative links
-            html: HTML content
+            doc: lxml root element of the page (None if parsing failed)
 
         Returns:
             List of link dictionaries
         """
-        soup = BeautifulSoup(html, "html.parser")
+        if doc is None:
+            return []
+
+        # iter("a") only wraps anchor elements in Python
         links = []
 
         # Find all article-like links
-        for a_tag in soup.find_all("a", href=True):
-            href = a_tag["href"]
-            absolute_url = urljoin(base_url, href)
-
-            # Filter out non-article links
-            parsed = urlparse(absolute_url)
-            if not parsed.scheme or parsed.scheme not in ["http", "https"]:
+        for a_tag in doc.iter("a"):
+            href = a_tag.get("href")
+            if href is None:
                 continue
 
-            # Skip common non-article patterns
-            skip_patterns = [
-                "#",
-                "javascript:",
-                "mailto:",
-                "/tag/",
-                "/category/",
-                "/author/",
-                "/page/",
-            ]
-            if any(pattern in href for pattern in skip_patterns):
+            # Skip common non-article patterns before doing any URL work
+            if _SKIP_LINK_PATTERN.search(href):
                 continue
 
+            # Absolute http(s) links need no resolving; only relative ones
+            # go through urljoin, and anything that isn't http(s) is dropped
+            if href[:8].lower().startswith(_HTTP_PREFIXES):
+                absolute_url = href
+            else:
+                absolute_url = urljoin(base_url, href)
+                if not absolute_url[:8].lower().startswith(_HTTP_PREFIXES):
+                    continue
+
             links.append(
                 {
                     "url": absolute_url,
-                    "text": a_tag.get_text(strip=True),
+                    "text": a_tag.text_content().strip(),
                     "title": a_tag.get("title", ""),
                 }
             )
@@ -6,10 +6,15 @@ and status. Supports application password authentication.
 """
 
 import base64
+import functools
+import html
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ..utils.config_loader import config_loader
 
 logger = logging.getLogger(__name__)
@@ -19,18 +24,63 @@ _wp_config = config_loader.get_wordpress_config()
 _wp_settings = _wp_config.get("wordpress", {})
 _site_url = _wp_settings.get("site_url", "https://mkfoster.com").rstrip("/")
 _api_endpoint = _wp_settings.get("api_endpoint", "/wp-json/wp/v2")
-_username = config_loader.get_env("WORDPRESS_USERNAME", "")
-_app_password = config_loader.get_env("WORDPRESS_APP_PASSWORD", "").replace(" ", "")  # Remove spaces from app password
-
-# Create session with authentication
-_session = requests.Session()
-_credentials = f"{_username}:{_app_password}"
-_token = base64.b64encode(_credentials.encode()).decode()
-_session.headers.update({
-    "Authorization": f"Basic {_token}",
-    "Content-Type": "application/json",
-    "User-Agent": "MyNewsRobot/1.0",
-})
+_POSTS_URL = f"{_site_url}{_api_endpoint}/posts"
+_CATEGORIES_URL = f"{_site_url}{_api_endpoint}/categories"
+
+# Category IDs by lowercased name; categories are never renamed or removed
+# by this tool, so an ID stays valid for the life of the process
+_category_id_cache: Dict[str, int] = {}
+_categories_loaded = False
+
+# Page size used when listing categories (the REST API maximum)
+CATEGORY_PAGE_SIZE = 100
+
+
+@functools.cache
+def _username() -> str:
+    """WordPress username from the environment."""
+    return config_loader.get_env("WORDPRESS_USERNAME", "")
+
+
+@functools.cache
+def _app_password() -> str:
+    """WordPress application password with its display spaces removed."""
+    return config_loader.get_env("WORDPRESS_APP_PASSWORD", "").replace(" ", "")
+
+
+@functools.cache
+def _auth_header() -> str:
+    """Basic auth header value for the configured credentials."""
+    credentials = f"{_username()}:{_app_password()}"
+    return "Basic " + base64.b64encode(credentials.encode()).decode()
+
+
+@functools.cache
+def _get_session() -> requests.Session:
+    """Authenticated, pooled session, created on first publish."""
+    session = requests.Session()
+    # Retries cover idempotent requests only (urllib3's default method list),
+    # so a POST that times out after WordPress accepted it is never sent twice.
+    # Once retries run out the last error response is returned rather than
+    # raised, so callers keep their own response.ok / raise_for_status handling
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "Authorization": _auth_header(),
+        "Content-Type": "application/json",
+        "User-Agent": "MyNewsRobot/1.0",
+    })
+    return session
 
 
 def publish_to_wordpress(
@@ -81,12 +131,13 @@ def publish_to_wordpress(
         if excerpt:
             post_data["excerpt"] = excerpt
 
-        # Create post
-        url = f"{_site_url}{_api_endpoint}/posts"
-        response = _session.post(url, json=post_data, timeout=30)
+        # Create post - orjson encodes straight to compact UTF-8 bytes (the
+        # session already sends a JSON Content-Type); non-ASCII characters
+        # stay raw instead of being expanded to \uXXXX escapes
+        response = _get_session().post(_POSTS_URL, data=orjson.dumps(post_data), timeout=30)
         response.raise_for_status()
 
-        post = response.json()
+        post = orjson.loads(response.content)
         post_id = post["id"]
         post_url = post["link"]
         edit_url = f"{_site_url}/wp-admin/post.php?post={post_id}&action=edit"
@@ -104,7 +155,7 @@ def publish_to_wordpress(
     except requests.exceptions.HTTPError as e:
         error_msg = f"HTTP error: {e.response.status_code}"
         try:
-            error_data = e.response.json()
+            error_data = orjson.loads(e.response.content)
             error_msg += f" - {error_data.get('message', '')}"
         except Exception:
             pass
@@ -132,31 +183,71 @@ def _get_or_create_categories(category_names: List[str]) -> List[int]:
         Returns:
             List of category IDs
         """
+        # Strip and lowercase each name once; blank names are skipped
+        names = [(name, name.lower()) for name in map(str.strip, category_names or []) if name]
+        if not names:
+            return []
+
         category_ids = []
 
-        for name in category_names:
-            # Search for existing category
-            url = f"{_site_url}{_api_endpoint}/categories"
-            response = _session.get(
-                url, params={"search": name, "per_page": 1}, timeout=10
-            )
+        # One listing of every category replaces a search per name
+        if not _categories_loaded and any(key not in _category_id_cache for _, key in names):
+            _load_categories()
+
+        for name, key in names:
+            if key in _category_id_cache:
+                category_ids.append(_category_id_cache[key])
+                continue
 
-            if response.ok:
-                categories = response.json()
-                if categories and categories[0]["name"].lower() == name.lower():
-                    category_ids.append(categories[0]["id"])
-                    continue
+            # Search for existing category (only when the listing failed)
+            if not _categories_loaded:
+                response = _get_session().get(
+                    _CATEGORIES_URL, params={"search": name, "per_page": 1}, timeout=10
+                )
+
+                if response.ok:
+                    categories = orjson.loads(response.content)
+                    if categories and html.unescape(categories[0]["name"]).lower() == key:
+                        _category_id_cache[key] = categories[0]["id"]
+                        category_ids.append(categories[0]["id"])
+                        continue
 
             # Category doesn't exist, create it
             try:
-                response = _session.post(
-                    url, json={"name": name}, timeout=10
+                response = _get_session().post(
+                    _CATEGORIES_URL, data=orjson.dumps({"name": name}), timeout=10
                 )
                 if response.ok:
-                    category = response.json()
+                    category = orjson.loads(response.content)
+                    _category_id_cache[key] = category["id"]
                     category_ids.append(category["id"])
                     logger.info(f"Created new category: {name} (ID: {category['id']})")
             except Exception as e:
                 logger.warning(f"Failed to create category {name}: {e}")
 
         return category_ids
+
+
+def _load_categories() -> None:
+    """Fill the category ID cache from the full category listing."""
+    global _categories_loaded
+
+    page = 1
+    try:
+        while True:
+            response = _get_session().get(
+                _CATEGORIES_URL, params={"per_page": CATEGORY_PAGE_SIZE, "page": page}, timeout=10
+            )
+            response.raise_for_status()
+            categories = orjson.loads(response.content)
+            for category in categories:
+                # Names come back HTML-escaped (e.g. "&amp;")
+                _category_id_cache[html.unescape(category["name"]).strip().lower()] = category["id"]
+            if len(categories) < CATEGORY_PAGE_SIZE:
+                break
+            page += 1
+    except Exception as e:
+        logger.warning(f"Failed to list categories, falling back to search: {e}")
+        return
+
+    _categories_loaded = True
@@ -6,11 +6,17 @@ Handles loading YAML configuration files and environment variables.
 
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import yaml
 from dotenv import load_dotenv
 
+# Prefer the libyaml-backed loader; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _YamlLoader
+
 
 class ConfigLoader:
     """Load and manage configuration from YAML files and environment variables."""
@@ -30,13 +36,38 @@ class ConfigLoader:
             config_dir = Path(__file__).parent.parent.parent / "config"
         self.config_dir = Path(config_dir)
 
-        # Cache for loaded configs
-        self._cache: Dict[str, Any] = {}
+        # Cache for loaded configs, keyed by filename -> (mtime_ns, config)
+        self._cache: Dict[str, Tuple[int, Any]] = {}
+
+        # Cache for resolved accessor results (YAML + env overrides applied)
+        self._resolved: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+    def _mtime(self, filename: str) -> int:
+        """
+        Get the modification time of a configuration file.
+
+        Args:
+            filename: Name of the YAML file
+
+        Returns:
+            File modification time in nanoseconds
+
+        Raises:
+            FileNotFoundError: If configuration file doesn't exist
+        """
+        file_path = self.config_dir / filename
+        try:
+            return file_path.stat().st_mtime_ns
+        except OSError:
+            raise FileNotFoundError(f"Configuration file not found: {file_path}")
 
     def load_yaml(self, filename: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Load a YAML configuration file.
 
+        Cached entries are reused only while the file's mtime is unchanged,
+        so edits on disk are picked up without restarting the service.
+
         Args:
             filename: Name of the YAML file (e.g., 'news_sources.yaml')
             use_cache: Whether to use cached version if available
@@ -48,32 +79,51 @@ class ConfigLoader:
             FileNotFoundError: If configuration file doesn't exist
             yaml.YAMLError: If YAML parsing fails
         """
-        if use_cache and filename in self._cache:
-            return self._cache[filename]
+        mtime = self._mtime(filename)
 
-        file_path = self.config_dir / filename
-        if not file_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {file_path}")
+        if use_cache:
+            cached = self._cache.get(filename)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        with open(self.config_dir / filename, "rb") as f:
+            config = yaml.load(f, Loader=_YamlLoader)
 
         if use_cache:
-            self._cache[filename] = config
+            self._cache[filename] = (mtime, config)
 
         return config
 
+    def _memoized(
+        self, key: str, filename: str, loader: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Return a resolved config, recomputing it when its file changes.
+
+        Args:
+            key: Cache key for the accessor
+            filename: YAML file the config is resolved from
+            loader: Callable that resolves the config
+
+        Returns:
+            Resolved configuration dictionary
+        """
+        mtime = self._mtime(filename)
+        cached = self._resolved.get(key)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, loader())
+            self._resolved[key] = cached
+        return cached[1]
+
     def get_news_sources(self) -> Dict[str, Any]:
         """Load news sources configuration."""
-        env_path = os.getenv("NEWS_SOURCES_CONFIG")
-        filename = env_path if env_path else "news_sources.yaml"
-        return self.load_yaml(filename)
+        filename = os.getenv("NEWS_SOURCES_CONFIG") or "news_sources.yaml"
+        return self._memoized("news_sources", filename, lambda: self.load_yaml(filename))
 
     def get_topic_priorities(self) -> Dict[str, Any]:
         """Load topic priorities configuration."""
-        env_path = os.getenv("TOPIC_PRIORITIES_CONFIG")
-        filename = env_path if env_path else "topic_priorities.yaml"
-        return self.load_yaml(filename)
+        filename = os.getenv("TOPIC_PRIORITIES_CONFIG") or "topic_priorities.yaml"
+        return self._memoized("topic_priorities", filename, lambda: self.load_yaml(filename))
 
     def get_weekly_bookmarks(self) -> Dict[str, Any]:
         """Load weekly bookmarks configuration."""
@@ -85,13 +135,18 @@ class ConfigLoader:
             filename = "weekly_bookmarks.yaml"
 
         try:
-            return self.load_yaml(filename, use_cache=False)  # Don't cache bookmarks
+            # Safe to cache: entries are re-read whenever the file changes
+            return self.load_yaml(filename)
         except FileNotFoundError:
             # Return empty bookmarks if file doesn't exist
             return {"bookmarks": []}
 
     def get_wordpress_config(self) -> Dict[str, Any]:
         """Load WordPress configuration."""
+        return self._memoized("wordpress", "wordpress.yaml", self._load_wordpress_config)
+
+    def _load_wordpress_config(self) -> Dict[str, Any]:
+        """Parse the WordPress file and apply environment overrides."""
         config = self.load_yaml("wordpress.yaml")
 
         # Override with environment variables if present
@@ -107,7 +162,9 @@ class ConfigLoader:
 
     def get_writing_style(self) -> Dict[str, Any]:
         """Load writing style configuration."""
-        return self.load_yaml("writing_style.yaml")
+        return self._memoized(
+            "writing_style", "writing_style.yaml", lambda: self.load_yaml("writing_style.yaml")
+        )
 
     def get_env(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """
@@ -140,9 +197,32 @@ class ConfigLoader:
         """Get Google Cloud configuration (legacy, use get_google_ai_config instead)."""
         return self.get_google_ai_config()
 
+    def get_all(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load every configuration the service reports on in one call.
+
+        Each entry comes from the mtime-keyed caches, so steady-state calls
+        only stat the files.
+
+        Returns:
+            Dictionary with news_sources, topic_priorities, weekly_bookmarks
+            and google_cloud entries
+        """
+        return {
+            "news_sources": self.get_news_sources(),
+            "topic_priorities": self.get_topic_priorities(),
+            "weekly_bookmarks": self.get_weekly_bookmarks(),
+            "google_cloud": self.get_google_cloud_config(),
+        }
+
+    def invalidate(self) -> None:
+        """Drop all cached configs so the next access re-reads them from disk."""
+        self._cache.clear()
+        self._resolved.clear()
+
     def reload(self) -> None:
         """Clear cache and reload environment variables."""
-        self._cache.clear()
+        self.invalidate()
         load_dotenv(override=True)
 
 
@@ -2,9 +2,20 @@
 Date formatting utilities for MyNewsRobot
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 
+# Offset from Monday 00:00:00 to Sunday 23:59:59
+_WEEK_TAIL = timedelta(days=6, hours=23, minutes=59, seconds=59)
+
+# Ordinal suffix indexed by day of month (index 0 is unused)
+_ORDINAL = (
+    "th", "st", "nd", "rd", "th", "th", "th", "th", "th", "th",
+    "th", "th", "th", "th", "th", "th", "th", "th", "th", "th",
+    "th", "st", "nd", "rd", "th", "th", "th", "th", "th", "th",
+    "th", "st",
+)
+
 
 def format_newsletter_date(
     date: Optional[datetime] = None, pattern: str = "%B %dth, %Y"
@@ -28,13 +39,9 @@ def format_newsletter_date(
 
     # Handle ordinal suffix (1st, 2nd, 3rd, 4th, etc.)
     day = date.day
-    if 10 <= day % 100 <= 20:
-        suffix = "th"
-    else:
-        suffix = {1: "st", 2: "nd", 3: "rd"}.get(day % 10, "th")
 
     # Replace %dth with actual day + suffix
-    formatted = date.strftime(pattern.replace("%dth", f"{day}{suffix}"))
+    formatted = date.strftime(pattern.replace("%dth", f"{day}{_ORDINAL[day]}"))
 
     return formatted
 
@@ -55,10 +62,10 @@ def get_week_range(date: Optional[datetime] = None) -> tuple[datetime, datetime]
     # Find Monday of the current week
     days_since_monday = date.weekday()
     week_start = date.replace(hour=0, minute=0, second=0, microsecond=0)
-    week_start = week_start - datetime.timedelta(days=days_since_monday)
+    week_start = week_start - timedelta(days=days_since_monday)
 
     # Find Sunday of the current week
-    week_end = week_start + datetime.timedelta(days=6, hours=23, minutes=59, seconds=59)
+    week_end = week_start + _WEEK_TAIL
 
     return week_start, week_end
 
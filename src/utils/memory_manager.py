@@ -2,10 +2,13 @@
 Memory management for MyNewsRobot using ADK InMemoryMemoryService
 """
 
-from typing import List, Optional, Set
-from datetime import datetime, timedelta
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from datetime import datetime
 
-from google.adk.memory import InMemoryMemoryService
+if TYPE_CHECKING:
+    from google.adk.memory import InMemoryMemoryService
 
 
 class MemoryManager:
@@ -18,9 +21,34 @@ class MemoryManager:
         Args:
             session_ttl_days: Number of days to keep article URLs in memory
         """
-        self.service = InMemoryMemoryService()
+        self._service: Optional["InMemoryMemoryService"] = None
         self.session_ttl_days = session_ttl_days
-        self._processed_urls: Set[str] = set()
+        # Normalized URL -> time it was last marked processed, plus the same
+        # (timestamp, url) pairs in insertion order for cheap TTL eviction
+        self._processed_urls: Dict[str, float] = {}
+        self._entries: Deque[Tuple[float, str]] = deque()
+        self._snapshot: Optional[FrozenSet[str]] = None
+
+    @property
+    def service(self) -> "InMemoryMemoryService":
+        """ADK memory service, created on first access (ADK is slow to import)."""
+        if self._service is None:
+            from google.adk.memory import InMemoryMemoryService
+            self._service = InMemoryMemoryService()
+        return self._service
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """
+        Normalize a URL into the form used for processed-URL lookups.
+
+        Args:
+            url: Article URL
+
+        Returns:
+            Normalized URL key
+        """
+        return url.strip().lower()
 
     def add_processed_url(self, url: str) -> None:
         """
@@ -29,7 +57,40 @@ class MemoryManager:
         Args:
             url: Article URL to mark as processed
         """
-        self._processed_urls.add(url.strip().lower())
+        self._mark(self.normalize_url(url), time.time())
+        self._snapshot = None
+
+    def add_processed_urls(self, urls: Iterable[str]) -> None:
+        """
+        Add several URLs to the processed articles list in one update.
+
+        Args:
+            urls: Article URLs to mark as processed
+        """
+        now = time.time()
+        for url in urls:
+            self._mark(self.normalize_url(url), now)
+        self._snapshot = None
+
+    def _mark(self, key: str, timestamp: float) -> None:
+        """Record a normalized URL as processed at the given time."""
+        self._processed_urls[key] = timestamp
+        self._entries.append((timestamp, key))
+
+    def get_processed_urls(self) -> FrozenSet[str]:
+        """
+        Get an immutable snapshot of normalized processed URLs.
+
+        The snapshot is cached until the processed set changes, so callers
+        filtering many URLs can do plain set membership checks against it.
+
+        Returns:
+            Frozen set of normalized URLs
+        """
+        self.clear_old_entries()
+        if self._snapshot is None:
+            self._snapshot = frozenset(self._processed_urls)
+        return self._snapshot
 
     def is_processed(self, url: str) -> bool:
         """
@@ -41,7 +102,7 @@ class MemoryManager:
         Returns:
             True if URL was processed within TTL period
         """
-        return url.strip().lower() in self._processed_urls
+        return self.normalize_url(url) in self._processed_urls
 
     def get_unprocessed_urls(self, urls: List[str]) -> List[str]:
         """
@@ -53,7 +114,10 @@ class MemoryManager:
         Returns:
             List of URLs that haven't been processed
         """
-        return [url for url in urls if not self.is_processed(url)]
+        self.clear_old_entries()
+        # Inlined normalize_url() and dict lookup: no method calls per URL
+        processed = self._processed_urls
+        return [url for url in urls if url.strip().lower() not in processed]
 
     def clear_old_entries(self) -> int:
         """
@@ -62,11 +126,19 @@ class MemoryManager:
         Returns:
             Number of entries cleared
         """
-        # In production, this would check timestamps
-        # For now, this is a placeholder for the basic implementation
-        initial_count = len(self._processed_urls)
-        # TODO: Implement timestamp-based cleanup
-        return 0
+        cutoff = time.time() - self.session_ttl_days * 86400
+        entries = self._entries
+        cleared = 0
+        while entries and entries[0][0] <= cutoff:
+            timestamp, key = entries.popleft()
+            # A URL marked again later has a newer entry further back
+            if self._processed_urls.get(key) == timestamp:
+                del self._processed_urls[key]
+                cleared += 1
+
+        if cleared:
+            self._snapshot = None
+        return cleared
 
     def get_processed_count(self) -> int:
         """
@@ -86,6 +158,7 @@ class MemoryManager:
         """
         return {
             "processed_urls": list(self._processed_urls),
+            "processed_at": dict(self._processed_urls),
             "timestamp": datetime.now().isoformat(),
             "ttl_days": self.session_ttl_days,
         }
@@ -98,7 +171,16 @@ class MemoryManager:
             state: Dictionary containing memory state
         """
         if "processed_urls" in state:
-            self._processed_urls = set(state["processed_urls"])
+            # States saved before timestamps were recorded count as fresh
+            processed_at = state.get("processed_at") or {}
+            now = time.time()
+            self._processed_urls = {}
+            self._entries = deque()
+            for timestamp, key in sorted(
+                (processed_at.get(key, now), key) for key in state["processed_urls"]
+            ):
+                self._mark(key, timestamp)
+            self._snapshot = None
 
         if "ttl_days" in state:
             self.session_ttl_days = state["ttl_days"]
@@ -0,0 +1,73 @@
+"""
+Shared pytest fixtures for MyNewsRobot tests
+"""
+
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def google_api_key():
+    """Provide a placeholder GOOGLE_API_KEY for the session, restored afterwards."""
+    with pytest.MonkeyPatch.context() as mp:
+        if not os.getenv("GOOGLE_API_KEY"):
+            mp.setenv("GOOGLE_API_KEY", "test-api-key")
+        yield
+
+
+# Agents are built once per test session and shared across tests. src.agents
+# (and with it ADK) is imported inside the fixtures so test modules that never
+# request an agent don't pay for the import at collection time.
+@pytest.fixture(scope="session")
+def analysis_agent():
+    """ContentAnalysisAgent instance."""
+    from src.agents import ContentAnalysisAgent
+
+    return ContentAnalysisAgent.create_agent()
+
+
+@pytest.fixture(scope="session")
+def writing_agent():
+    """ContentWritingAgent instance."""
+    from src.agents import ContentWritingAgent
+
+    return ContentWritingAgent.create_agent()
+
+
+@pytest.fixture(scope="session")
+def publishing_agent():
+    """PublishingAgent instance."""
+    from src.agents import PublishingAgent
+
+    return PublishingAgent.create_agent()
+
+
+@pytest.fixture(scope="session")
+def tool_names_of():
+    """Return a function giving the set of tool names attached to an agent."""
+    cache = {}
+
+    def tool_names(agent):
+        key = id(agent)
+        if key not in cache:
+            cache[key] = frozenset(
+                getattr(tool, "__name__", type(tool).__name__) for tool in agent.tools or ()
+            )
+        return cache[key]
+
+    return tool_names
+
+
+@pytest.fixture(scope="session")
+def instruction_lower():
+    """Return a function giving an agent's lowercased instruction, computed once."""
+    cache = {}
+
+    def lowered(agent):
+        key = id(agent)
+        if key not in cache:
+            cache[key] = agent.instruction.lower()
+        return cache[key]
+
+    return lowered
@@ -9,7 +9,6 @@ Tests verify that agents are correctly configured with:
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
 
 from google.adk.agents.llm_agent import Agent
 
@@ -18,47 +17,35 @@ from src.agents import (
     ContentWritingAgent,
     PublishingAgent,
 )
-from src.tools import scrape_web_content, load_user_bookmarks, publish_to_wordpress
+
+pytestmark = pytest.mark.integration
 
 
 class TestContentAnalysisAgent:
     """Tests for ContentAnalysisAgent configuration and functionality."""
 
-    def test_create_agent_returns_agent_instance(self):
+    def test_create_agent_returns_agent_instance(self, analysis_agent):
         """Test that create_agent returns an ADK Agent instance."""
-        agent = ContentAnalysisAgent.create_agent()
-        assert isinstance(agent, Agent)
+        assert isinstance(analysis_agent, Agent)
 
-    def test_agent_has_correct_name(self):
+    def test_agent_has_correct_name(self, analysis_agent):
         """Test agent has the correct name."""
-        agent = ContentAnalysisAgent.create_agent()
-        assert agent.name == "ContentAnalysisAgent"
+        assert analysis_agent.name == "ContentAnalysisAgent"
 
-    def test_agent_has_correct_model(self):
+    def test_agent_has_correct_model(self, analysis_agent):
         """Test agent uses gemini-2.5-flash model."""
-        agent = ContentAnalysisAgent.create_agent()
-        assert agent.model == "gemini-2.5-flash"
+        assert analysis_agent.model == "gemini-2.5-flash"
 
-    def test_agent_has_description(self):
+    def test_agent_has_description(self, analysis_agent):
         """Test agent has a description."""
-        agent = ContentAnalysisAgent.create_agent()
-        assert agent.description is not None
-        assert len(agent.description) > 0
+        assert analysis_agent.description is not None
+        assert len(analysis_agent.description) > 0
 
-    def test_agent_has_instruction(self):
+    def test_agent_has_instruction(self, analysis_agent, instruction_lower):
         """Test agent has instruction prompt."""
-        agent = ContentAnalysisAgent.create_agent()
-        assert agent.instruction is not None
-        assert len(agent.instruction) > 0
-        assert "content analysis" in agent.instruction.lower()
-
-    def test_agent_has_get_topic_priorities_tool(self):
-        """Test agent has get_topic_priorities tool."""
-        agent = ContentAnalysisAgent.create_agent()
-        assert agent.tools is not None
-        assert len(agent.tools) == 1
-        tool_name = agent.tools[0].__name__ if hasattr(agent.tools[0], '__name__') else type(agent.tools[0]).__name__
-        assert tool_name == "get_topic_priorities"
+        assert analysis_agent.instruction is not None
+        assert len(analysis_agent.instruction) > 0
+        assert "content analysis" in instruction_lower(analysis_agent)
 
     def test_get_topic_priorities_tool_returns_dict(self):
         """Test get_topic_priorities tool returns a dictionary."""
@@ -66,51 +53,138 @@ class TestContentAnalysisAgent:
         priorities = get_topic_priorities()
         assert isinstance(priorities, dict)
 
-    def test_instruction_mentions_priority_scale(self):
+    def test_select_articles_scores_by_keyword(self):
+        """Test local selection assigns topic priorities and puts bookmarks first."""
+        topics = [
+            {"name": "AI", "keywords": ["AI", "machine learning"], "priority": 10},
+            {"name": "Programming", "keywords": ["C++", "Go"], "priority": 7},
+        ]
+        articles = [
+            {"url": "https://a.test/1", "title": "New C++ standard", "excerpt": ""},
+            {"url": "https://a.test/2", "title": "Said the chef", "excerpt": ""},
+            {"url": "https://a.test/3", "title": "Machine learning at scale", "excerpt": ""},
+            {"url": "https://a.test/4", "title": "My pick", "is_bookmark": True},
+        ]
+
+        selected = ContentAnalysisAgent.select_articles(articles, topics)
+
+        assert [a["url"] for a in selected] == [
+            "https://a.test/4",
+            "https://a.test/3",
+            "https://a.test/1",
+            "https://a.test/2",
+        ]
+        assert [a["priority"] for a in selected] == [11, 10, 7, 0]
+        assert selected[1]["matched_topic"] == "AI"
+        assert selected[3]["matched_topic"] == "Other"
+
+    @pytest.mark.parametrize(
+        "title",
+        ["How markets react to rate cuts", "Ready to go camping", "Said the chef"],
+    )
+    def test_select_articles_ignores_common_words(self, title):
+        """Test short and capitalized keywords don't match ordinary lowercase words."""
+        topics = [
+            {"name": "Web", "keywords": ["React"], "priority": 9},
+            {"name": "Programming", "keywords": ["Go"], "priority": 7},
+            {"name": "AI", "keywords": ["AI", "machine learning"], "priority": 10},
+        ]
+        selected = ContentAnalysisAgent.select_articles(
+            [{"url": "https://a.test/1", "title": title}], topics
+        )
+        assert selected[0]["matched_topic"] == "Other"
+
+    @pytest.mark.parametrize(
+        "title,topic",
+        [
+            ("Machine Learning at scale", "AI"),
+            # Long s: IGNORECASE matches it, and it casefolds to "rust"
+            ("Why ruſt is fast", "Programming"),
+        ],
+    )
+    def test_select_articles_lowercase_keywords_match_any_case(self, title, topic):
+        """Test longer lowercase keywords still match regardless of case."""
+        topics = [
+            {"name": "AI", "keywords": ["machine learning"], "priority": 10},
+            {"name": "Programming", "keywords": ["rust"], "priority": 7},
+        ]
+        selected = ContentAnalysisAgent.select_articles(
+            [{"url": "https://a.test/1", "title": title}], topics
+        )
+        assert selected[0]["matched_topic"] == topic
+
+    def test_select_articles_fills_open_slots_with_unmatched(self):
+        """Test a single topic match doesn't shrink the selection below the limit."""
+        topics = [{"name": "AI", "keywords": ["AI"], "priority": 10}]
+        articles = [{"url": "https://a.test/0", "title": "AI news"}] + [
+            {"url": f"https://a.test/{i}", "title": "Garden update"} for i in range(1, 30)
+        ]
+        selected = ContentAnalysisAgent.select_articles(articles, topics, limit=20)
+        assert len(selected) == 20
+        assert selected[0]["url"] == "https://a.test/0"
+
+    def test_select_articles_caps_articles_per_topic(self):
+        """Test local selection keeps at most per_topic_limit articles per topic."""
+        topics = [{"name": "AI", "keywords": ["AI"], "priority": 10}]
+        articles = [{"url": f"https://a.test/{i}", "title": "AI news"} for i in range(15)]
+
+        selected = ContentAnalysisAgent.select_articles(articles, topics, per_topic_limit=10)
+        assert len(selected) == 10
+
+    def test_compact_articles_round_trip(self):
+        """Test agent selections by index map back onto the full articles."""
+        articles = [
+            {"url": "https://a.test/1", "title": "One", "excerpt": "x" * 500, "category": "ai"},
+            {"url": "https://a.test/2", "title": "Two", "excerpt": None, "category": "web"},
+        ]
+
+        compact = ContentAnalysisAgent.compact_articles(articles)
+        assert compact[0] == {"i": 0, "t": "One", "x": "x" * 300, "c": "ai"}
+        assert compact[1]["x"] == ""
+
+        selected = ContentAnalysisAgent.expand_selections(
+            articles,
+            [
+                {"i": 1, "priority": 9, "matched_topic": "Web"},
+                {"i": 1, "priority": 9, "matched_topic": "Web"},
+                {"i": 7, "priority": 8, "matched_topic": "AI"},
+            ],
+        )
+        assert selected == [{**articles[1], "priority": 9, "matched_topic": "Web"}]
+
+    def test_instruction_mentions_priority_scale(self, analysis_agent, instruction_lower):
         """Test instruction mentions the 7-11 priority scale."""
-        agent = ContentAnalysisAgent.create_agent()
-        instruction = agent.instruction.lower()
+        instruction = instruction_lower(analysis_agent)
         assert "priority" in instruction
         # Should mention the scale or range
-        assert "7" in agent.instruction or "11" in agent.instruction
+        assert "7" in analysis_agent.instruction or "11" in analysis_agent.instruction
 
 
 class TestContentWritingAgent:
     """Tests for ContentWritingAgent configuration and functionality."""
 
-    def test_create_agent_returns_agent_instance(self):
+    def test_create_agent_returns_agent_instance(self, writing_agent):
         """Test that create_agent returns an ADK Agent instance."""
-        agent = ContentWritingAgent.create_agent()
-        assert isinstance(agent, Agent)
+        assert isinstance(writing_agent, Agent)
 
-    def test_agent_has_correct_name(self):
+    def test_agent_has_correct_name(self, writing_agent):
         """Test agent has the correct name."""
-        agent = ContentWritingAgent.create_agent()
-        assert agent.name == "ContentWritingAgent"
+        assert writing_agent.name == "ContentWritingAgent"
 
-    def test_agent_has_correct_model(self):
+    def test_agent_has_correct_model(self, writing_agent):
         """Test agent uses gemini-2.5-flash model."""
-        agent = ContentWritingAgent.create_agent()
-        assert agent.model == "gemini-2.5-flash"
+        assert writing_agent.model == "gemini-2.5-flash"
 
-    def test_agent_has_description(self):
+    def test_agent_has_description(self, writing_agent):
         """Test agent has a description."""
-        agent = ContentWritingAgent.create_agent()
-        assert agent.description is not None
-        assert len(agent.description) > 0
+        assert writing_agent.description is not None
+        assert len(writing_agent.description) > 0
 
-    def test_agent_has_instruction(self):
+    def test_agent_has_instruction(self, writing_agent, instruction_lower):
         """Test agent has instruction prompt."""
-        agent = ContentWritingAgent.create_agent()
-        assert agent.instruction is not None
-        assert len(agent.instruction) > 0
-        assert "content writing" in agent.instruction.lower()
-
-    def test_agent_has_no_tools(self):
-        """Test agent has no tools (pure generation)."""
-        agent = ContentWritingAgent.create_agent()
-        # ADK agents may have empty list or None for no tools
-        assert agent.tools is None or len(agent.tools) == 0
+        assert writing_agent.instruction is not None
+        assert len(writing_agent.instruction) > 0
+        assert "content writing" in instruction_lower(writing_agent)
 
     def test_get_writing_style_returns_dict(self):
         """Test get_writing_style returns a dictionary."""
@@ -123,247 +197,123 @@ class TestContentWritingAgent:
         assert isinstance(date, str)
         assert len(date) > 0
 
-    def test_instruction_mentions_token_limit(self):
+    def test_summary_and_intro_agents_use_structured_output(self):
+        """Test the fan-out writing agents declare output schemas and no tools."""
+        for agent in (
+            ContentWritingAgent.create_summary_agent(),
+            ContentWritingAgent.create_intro_agent(),
+        ):
+            assert isinstance(agent, Agent)
+            assert agent.output_schema is not None
+            assert agent.tools is None or len(agent.tools) == 0
+
+    def test_render_newsletter_builds_expected_html(self):
+        """Test render_newsletter produces the documented HTML structure."""
+        html = ContentWritingAgent.render_newsletter(
+            "Intro & themes",
+            [{"url": "https://a.test/1", "title": "First", "summary": "Summary one"}],
+            "Wrap-up",
+        )
+        assert html.startswith("<h2>From MyNewsRobot:</h2>")
+        assert "<p>Intro &amp; themes</p>" in html
+        assert "<ol>" in html and "<h3>First</h3>" in html
+        assert '<a href="https://a.test/1">' in html
+        assert "<h1>" not in html
+
+    def test_instruction_mentions_token_limit(self, writing_agent, instruction_lower):
         """Test instruction mentions ~200 token limit."""
-        agent = ContentWritingAgent.create_agent()
-        instruction = agent.instruction.lower()
-        assert "200" in agent.instruction or "token" in instruction
+        instruction = instruction_lower(writing_agent)
+        assert "200" in writing_agent.instruction or "token" in instruction
 
 
 class TestPublishingAgent:
     """Tests for PublishingAgent configuration and functionality."""
 
-    @patch("src.agents.publishing_agent.config_loader")
-    def test_create_agent_returns_agent_instance(self, mock_config):
+    def test_create_agent_returns_agent_instance(self, publishing_agent):
         """Test that create_agent returns an ADK Agent instance."""
-        # Mock configuration
-        mock_config.get_wordpress_config.return_value = {
-            "wordpress": {
-                "site_url": "https://example.com",
-                "api_endpoint": "/wp-json/wp/v2",
-            }
-        }
-        mock_config.get_env.return_value = "test_value"
-
-        agent = PublishingAgent.create_agent()
-        assert isinstance(agent, Agent)
-
-    @patch("src.agents.publishing_agent.config_loader")
-    def test_agent_has_correct_name(self, mock_config):
+        assert isinstance(publishing_agent, Agent)
+
+    def test_agent_has_correct_name(self, publishing_agent):
         """Test agent has the correct name."""
-        mock_config.get_wordpress_config.return_value = {
-            "wordpress": {
-                "site_url": "https://example.com",
-                "api_endpoint": "/wp-json/wp/v2",
-            }
-        }
-        mock_config.get_env.return_value = "test_value"
-
-        agent = PublishingAgent.create_agent()
-        assert agent.name == "PublishingAgent"
-
-    @patch("src.agents.publishing_agent.config_loader")
-    def test_agent_has_correct_model(self, mock_config):
+        assert publishing_agent.name == "PublishingAgent"
+
+    def test_agent_has_correct_model(self, publishing_agent):
         """Test agent uses gemini-2.0-flash-exp model."""
-        mock_config.get_wordpress_config.return_value = {
-            "wordpress": {
-                "site_url": "https://example.com",
-                "api_endpoint": "/wp-json/wp/v2",
-            }
-        }
-        mock_config.get_env.return_value = "test_value"
-
-        agent = PublishingAgent.create_agent()
-        assert agent.model == "gemini-2.5-flash"
-
-    @patch("src.agents.publishing_agent.config_loader")
-    def test_agent_has_description(self, mock_config):
+        assert publishing_agent.model == "gemini-2.5-flash"
+
+    def test_agent_has_description(self, publishing_agent):
         """Test agent has a description."""
-        mock_config.get_wordpress_config.return_value = {
-            "wordpress": {
-                "site_url": "https://example.com",
-                "api_endpoint": "/wp-json/wp/v2",
-            }
-        }
-        mock_config.get_env.return_value = "test_value"
-
-        agent = PublishingAgent.create_agent()
-        assert agent.description is not None
-        assert len(agent.description) > 0
-
-    @patch("src.agents.publishing_agent.config_loader")
-    def test_agent_has_instruction(self, mock_config):
+        assert publishing_agent.description is not None
+        assert len(publishing_agent.description) > 0
+
+    def test_agent_has_instruction(self, publishing_agent, instruction_lower):
         """Test agent has instruction prompt."""
-        mock_config.get_wordpress_config.return_value = {
-            "wordpress": {
-                "site_url": "https://example.com",
-                "api_endpoint": "/wp-json/wp/v2",
-            }
-        }
-        mock_config.get_env.return_value = "test_value"
-
-        agent = PublishingAgent.create_agent()
-        assert agent.instruction is not None
-        assert len(agent.instruction) > 0
-        assert "publishing" in agent.instruction.lower()
-
-    @patch("src.agents.publishing_agent.config_loader")
-    def test_agent_has_wordpress_tool(self, mock_config):
-        """Test agent has publish_to_wordpress tool attached."""
-        mock_config.get_wordpress_config.return_value = {
-            "wordpress": {
-                "site_url": "https://example.com",
-                "api_endpoint": "/wp-json/wp/v2",
-            }
-        }
-        mock_config.get_env.return_value = "test_value"
-
-        agent = PublishingAgent.create_agent()
-        assert agent.tools is not None
-        tool_names = [tool.__name__ if hasattr(tool, '__name__') else type(tool).__name__ for tool in agent.tools]
-        assert "publish_to_wordpress" in tool_names
-
-    @patch("src.agents.publishing_agent.config_loader")
-    def test_agent_has_one_tool(self, mock_config):
-        """Test agent has exactly one tool (publish_to_wordpress)."""
-        mock_config.get_wordpress_config.return_value = {
-            "wordpress": {
-                "site_url": "https://example.com",
-                "api_endpoint": "/wp-json/wp/v2",
-            }
-        }
-        mock_config.get_env.return_value = "test_value"
-
-        agent = PublishingAgent.create_agent()
-        assert agent.tools is not None
-        assert len(agent.tools) == 1
+        assert publishing_agent.instruction is not None
+        assert len(publishing_agent.instruction) > 0
+        assert "publishing" in instruction_lower(publishing_agent)
 
     def test_get_wordpress_config_returns_dict(self):
         """Test get_wordpress_config returns a dictionary."""
         config = PublishingAgent.get_wordpress_config()
         assert isinstance(config, dict)
 
-    @patch("src.agents.publishing_agent.config_loader")
-    def test_instruction_mentions_private_status(self, mock_config):
+    def test_instruction_mentions_private_status(self, publishing_agent, instruction_lower):
         """Test instruction mentions private post status."""
-        mock_config.get_wordpress_config.return_value = {
-            "wordpress": {
-                "site_url": "https://example.com",
-                "api_endpoint": "/wp-json/wp/v2",
-            }
-        }
-        mock_config.get_env.return_value = "test_value"
-
-        agent = PublishingAgent.create_agent()
-        instruction = agent.instruction.lower()
+        instruction = instruction_lower(publishing_agent)
         assert "private" in instruction
 
-    @patch("src.agents.publishing_agent.config_loader")
-    def test_instruction_mentions_weekly_summary_category(self, mock_config):
+    def test_instruction_mentions_weekly_summary_category(self, publishing_agent, instruction_lower):
         """Test instruction mentions WeeklySummary category."""
-        mock_config.get_wordpress_config.return_value = {
-            "wordpress": {
-                "site_url": "https://example.com",
-                "api_endpoint": "/wp-json/wp/v2",
-            }
-        }
-        mock_config.get_env.return_value = "test_value"
-
-        agent = PublishingAgent.create_agent()
-        assert "WeeklySummary" in agent.instruction or "weekly" in agent.instruction.lower()
+        assert "WeeklySummary" in publishing_agent.instruction or "weekly" in instruction_lower(publishing_agent)
 
 
 class TestAgentIntegration:
     """Integration tests across all agents."""
 
-    @patch("src.agents.publishing_agent.config_loader")
-    def test_all_agents_use_same_model(self, mock_config):
-        """Test all agents use the same model."""
-        mock_config.get_wordpress_config.return_value = {
-            "wordpress": {
-                "site_url": "https://example.com",
-                "api_endpoint": "/wp-json/wp/v2",
-            }
-        }
-        mock_config.get_env.return_value = "test_value"
-
-        agents = [
-            ContentAnalysisAgent.create_agent(),
-            ContentWritingAgent.create_agent(),
-            PublishingAgent.create_agent(),
-        ]
-
-        models = [agent.model for agent in agents]
-        assert all(model == "gemini-2.5-flash" for model in models)
-
-    @patch("src.agents.publishing_agent.config_loader")
-    def test_all_agents_have_unique_names(self, mock_config):
+    @pytest.fixture
+    def all_agents(self, analysis_agent, writing_agent, publishing_agent):
+        """Every workflow agent, built once per session."""
+        return [analysis_agent, writing_agent, publishing_agent]
+
+    @pytest.mark.parametrize(
+        "attr,check",
+        [
+            ("model", lambda model: model == "gemini-2.5-flash"),
+            ("description", lambda description: description is not None and len(description) > 0),
+            ("instruction", lambda instruction: instruction is not None and len(instruction) > 0),
+        ],
+        ids=["same_model", "descriptions", "instructions"],
+    )
+    def test_all_agents_attribute(self, all_agents, attr, check):
+        """Test all agents share the model and have non-empty descriptions and instructions."""
+        for agent in all_agents:
+            assert check(getattr(agent, attr)), f"{agent.name}.{attr}"
+
+    def test_all_agents_have_unique_names(self, all_agents):
         """Test all agents have unique names."""
-        mock_config.get_wordpress_config.return_value = {
-            "wordpress": {
-                "site_url": "https://example.com",
-                "api_endpoint": "/wp-json/wp/v2",
-            }
-        }
-        mock_config.get_env.return_value = "test_value"
-
-        agents = [
-            ContentAnalysisAgent.create_agent(),
-            ContentWritingAgent.create_agent(),
-            PublishingAgent.create_agent(),
-        ]
-
-        names = [agent.name for agent in agents]
-        assert len(names) == len(set(names))  # All names are unique
-
-    @patch("src.agents.publishing_agent.config_loader")
-    def test_all_agents_have_descriptions(self, mock_config):
-        """Test all agents have non-empty descriptions."""
-        mock_config.get_wordpress_config.return_value = {
-            "wordpress": {
-                "site_url": "https://example.com",
-                "api_endpoint": "/wp-json/wp/v2",
-            }
-        }
-        mock_config.get_env.return_value = "test_value"
-
-        agents = [
-            ContentAnalysisAgent.create_agent(),
-            ContentWritingAgent.create_agent(),
-            PublishingAgent.create_agent(),
-        ]
-
-        for agent in agents:
-            assert agent.description is not None
-            assert len(agent.description) > 0
-
-    @patch("src.agents.publishing_agent.config_loader")
-    def test_all_agents_have_instructions(self, mock_config):
-        """Test all agents have non-empty instructions."""
-        mock_config.get_wordpress_config.return_value = {
-            "wordpress": {
-                "site_url": "https://example.com",
-                "api_endpoint": "/wp-json/wp/v2",
-            }
-        }
-        mock_config.get_env.return_value = "test_value"
-
-        agents = [
-            ContentAnalysisAgent.create_agent(),
-            ContentWritingAgent.create_agent(),
-            PublishingAgent.create_agent(),
-        ]
-
-        for agent in agents:
-            assert agent.instruction is not None
-            assert len(agent.instruction) > 0
-
-    def test_tool_usage_across_agents(self):
+        assert len({agent.name for agent in all_agents}) == len(all_agents)
+
+    def test_create_agent_returns_fresh_instance(self):
+        """Test each call builds a new agent, since ADK allows only one parent per agent."""
+        from google.adk.agents import SequentialAgent
+
+        factories = (ContentAnalysisAgent, ContentWritingAgent, PublishingAgent)
+        for factory in factories:
+            assert factory.create_agent() is not factory.create_agent()
+        for name in ("first", "second"):
+            SequentialAgent(name=name, sub_agents=[f.create_agent() for f in factories])
+
+    @pytest.mark.parametrize(
+        "agent_fixture,expected_count,required",
+        [
+            ("analysis_agent", 1, {"get_topic_priorities"}),
+            # Pure generation; ADK may use an empty list or None for no tools
+            ("writing_agent", 0, set()),
+            ("publishing_agent", 1, {"publish_to_wordpress"}),
+        ],
+    )
+    def test_tool_wiring(self, request, tool_names_of, agent_fixture, expected_count, required):
         """Test that tools are correctly distributed across agents."""
-        # ContentAnalysisAgent should have 1 tool (get_topic_priorities)
-        analysis_agent = ContentAnalysisAgent.create_agent()
-        assert len(analysis_agent.tools) == 1
-
-        # ContentWritingAgent should have 0 tools
-        writing_agent = ContentWritingAgent.create_agent()
-        assert writing_agent.tools is None or len(writing_agent.tools) == 0
+        agent = request.getfixturevalue(agent_fixture)
+        assert len(agent.tools or []) == expected_count
+        assert required <= tool_names_of(agent)
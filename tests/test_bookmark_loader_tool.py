@@ -0,0 +1,45 @@
+"""
+Test bookmark loading and its per-file cache
+"""
+
+import pytest
+
+from src.tools.bookmark_loader_tool import load_user_bookmarks
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def bookmarks_file(tmp_path):
+    """Bookmark YAML file with one entry."""
+    path = tmp_path / "weekly_bookmarks.yaml"
+    path.write_text(
+        'bookmarks:\n  - url: "https://a.test/1"\n    note: "Read this"\n', encoding="utf-8"
+    )
+    return str(path)
+
+
+def test_load_user_bookmarks_fills_defaults(bookmarks_file):
+    """Test bookmarks get default fields and the top priority."""
+    result = load_user_bookmarks(bookmarks_file)
+    assert result["success"] is True
+    assert result["count"] == 1
+    assert result["bookmarks"] == [
+        {"url": "https://a.test/1", "note": "Read this", "submitted_date": "", "priority": 11}
+    ]
+
+
+def test_mutating_a_result_does_not_change_the_cache(bookmarks_file):
+    """Test callers editing a returned result don't affect later loads."""
+    first = load_user_bookmarks(bookmarks_file)
+    first["bookmarks"][0]["priority"] = 1
+    first["bookmarks"].append({"url": "https://a.test/2"})
+    first["bookmarks"].sort(key=lambda bookmark: bookmark["url"], reverse=True)
+
+    second = load_user_bookmarks(bookmarks_file)
+    assert second["bookmarks"] == [
+        {"url": "https://a.test/1", "note": "Read this", "submitted_date": "", "priority": 11}
+    ]
+
+    second["bookmarks"][0]["note"] = "changed"
+    assert load_user_bookmarks(bookmarks_file)["bookmarks"][0]["note"] == "Read this"
@@ -6,6 +6,14 @@ import pytest
 from pathlib import Path
 from src.utils.config_loader import ConfigLoader
 
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(scope="module")
+def loader():
+    """Loader shared by read-only tests so each YAML file is parsed once."""
+    return ConfigLoader()
+
 
 def test_config_loader_initialization():
     """Test that config loader initializes correctly."""
@@ -14,17 +22,15 @@ def test_config_loader_initialization():
     assert loader._cache == {}
 
 
-def test_load_news_sources():
+def test_load_news_sources(loader):
     """Test loading news sources configuration."""
-    loader = ConfigLoader()
     sources = loader.get_news_sources()
     assert "news_sources" in sources
     assert isinstance(sources["news_sources"], dict)
 
 
-def test_load_topic_priorities():
+def test_load_topic_priorities(loader):
     """Test loading topic priorities configuration."""
-    loader = ConfigLoader()
     topics = loader.get_topic_priorities()
     assert "topics" in topics
     assert isinstance(topics["topics"], list)
@@ -38,13 +44,40 @@ def test_load_topic_priorities():
 
 def test_get_google_ai_config():
     """Test getting Google AI Studio configuration."""
-    import os
-    # Set a test API key if not already set
-    if not os.getenv("GOOGLE_API_KEY"):
-        os.environ["GOOGLE_API_KEY"] = "test-api-key"
-    
     loader = ConfigLoader()
     config = loader.get_google_ai_config()
     assert "api_key" in config
     assert "project" in config
     assert "location" in config
+
+
+def test_accessors_are_memoized_until_reload():
+    """Test that resolved configs are reused until reload() is called."""
+    loader = ConfigLoader()
+    first = loader.get_topic_priorities()
+    assert loader.get_topic_priorities() is first
+
+    loader.reload()
+    assert loader.get_topic_priorities() is not first
+
+
+def test_load_yaml_rereads_file_when_mtime_changes(tmp_path):
+    """Test that cached YAML is refreshed after the file changes on disk."""
+    import os
+
+    config_file = tmp_path / "sample.yaml"
+    config_file.write_text("value: 1\n", encoding="utf-8")
+    loader = ConfigLoader(config_dir=tmp_path)
+    assert loader.load_yaml("sample.yaml") == {"value": 1}
+
+    config_file.write_text("value: 2\n", encoding="utf-8")
+    stat = config_file.stat()
+    os.utime(config_file, (stat.st_atime, stat.st_mtime + 10))
+    assert loader.load_yaml("sample.yaml") == {"value": 2}
+
+
+def test_get_all_returns_every_config(loader):
+    """Test that get_all bundles the configs reported by /config/status."""
+    cfg = loader.get_all()
+    assert set(cfg) == {"news_sources", "topic_priorities", "weekly_bookmarks", "google_cloud"}
+    assert cfg["topic_priorities"] is loader.get_topic_priorities()
@@ -0,0 +1,24 @@
+"""
+Test date formatting utilities
+"""
+
+import pytest
+from datetime import datetime
+from src.utils.date_formatter import format_newsletter_date, get_week_range
+
+pytestmark = pytest.mark.unit
+
+
+def test_get_week_range_spans_monday_to_sunday():
+    """Test week range runs from Monday midnight to Sunday 23:59:59."""
+    week_start, week_end = get_week_range(datetime(2025, 11, 28, 15, 30))
+    assert week_start == datetime(2025, 11, 24)
+    assert week_end == datetime(2025, 11, 30, 23, 59, 59)
+
+
+def test_format_newsletter_date_ordinal_suffixes():
+    """Test day numbers get the right ordinal suffix."""
+    assert format_newsletter_date(datetime(2025, 11, 1)) == "November 1st, 2025"
+    assert format_newsletter_date(datetime(2025, 11, 12)) == "November 12th, 2025"
+    assert format_newsletter_date(datetime(2025, 11, 22)) == "November 22nd, 2025"
+    assert format_newsletter_date(datetime(2025, 11, 28)) == "November 28th, 2025"
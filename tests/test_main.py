@@ -0,0 +1,78 @@
+"""
+Test the newsletter pipeline steps in src.main with the agents stubbed out
+"""
+
+import pytest
+
+from src import main
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def agents_unavailable(monkeypatch, tmp_path):
+    """Make every agent run return unparseable text and keep drafts in tmp_path."""
+
+    async def run_agent_with_timeout(app_name, prompt, label):
+        return "not json", 0
+
+    monkeypatch.setattr(main, "run_agent_with_timeout", run_agent_with_timeout)
+    # write_newsletter saves its draft next to main.py
+    monkeypatch.setattr(main, "__file__", str(tmp_path / "main.py"))
+
+
+def test_plain_text_strips_tags_and_decodes_entities():
+    """Test excerpts are reduced to plain text exactly once."""
+    assert main._plain_text("<p>It&#8217;s <b>R&amp;D</b></p>") == "It’s R&D"
+    assert main._plain_text(None) == ""
+
+
+@pytest.mark.asyncio
+async def test_write_newsletter_falls_back_to_plain_excerpts(agents_unavailable):
+    """Test RSS excerpts used as fallback summaries are escaped only once."""
+    articles = [
+        {
+            "url": "https://a.test/1",
+            "title": "First",
+            "excerpt": "<p>It&#8217;s R&amp;D week</p>",
+        }
+    ]
+
+    newsletter = await main.write_newsletter(articles, "November 30th, 2025")
+
+    assert "<p>It’s R&amp;D week</p>" in newsletter
+    assert "&amp;#8217;" not in newsletter
+    assert "&amp;amp;" not in newsletter
+
+
+@pytest.mark.asyncio
+async def test_run_workflow_uses_requested_date_throughout(monkeypatch, tmp_path):
+    """Test the newsletter body and the post title get the same requested date."""
+    import src.news_scraper
+
+    dates = {}
+
+    async def discover_articles(session):
+        return []
+
+    async def analyze_articles(articles):
+        return []
+
+    async def write_newsletter(articles, newsletter_date):
+        dates["body"] = newsletter_date
+        return "<p>Body</p>"
+
+    async def publish_newsletter(newsletter_html, newsletter_date):
+        dates["title"] = newsletter_date
+        return {"success": True, "post_url": "https://example.com/?p=1"}
+
+    monkeypatch.setattr(src.news_scraper, "discover_articles", discover_articles)
+    monkeypatch.setattr(main, "analyze_articles", analyze_articles)
+    monkeypatch.setattr(main, "write_newsletter", write_newsletter)
+    monkeypatch.setattr(main, "publish_newsletter", publish_newsletter)
+    # run_workflow saves the analysis next to main.py
+    monkeypatch.setattr(main, "__file__", str(tmp_path / "main.py"))
+
+    await main.run_workflow(main.RunRequest(newsletter_date="December 1st, 2025"))
+
+    assert dates == {"body": "December 1st, 2025", "title": "December 1st, 2025"}
@@ -0,0 +1,104 @@
+"""
+Test processed-URL memory and its TTL eviction
+"""
+
+import types
+
+import pytest
+
+from src.utils import memory_manager as memory_manager_module
+from src.utils.memory_manager import MemoryManager
+
+pytestmark = pytest.mark.unit
+
+DAY = 86400
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable clock for the memory manager module, starting at day 100."""
+    now = types.SimpleNamespace(value=100 * DAY)
+    monkeypatch.setattr(
+        memory_manager_module, "time", types.SimpleNamespace(time=lambda: now.value)
+    )
+
+    def advance(days):
+        now.value += days * DAY
+
+    return advance
+
+
+@pytest.fixture
+def memory(clock):
+    """Empty memory manager with a 7 day TTL."""
+    return MemoryManager(session_ttl_days=7)
+
+
+def test_add_processed_urls_normalizes_and_snapshots(memory):
+    """Test batch-added URLs are normalized and the snapshot is reused until a change."""
+    memory.add_processed_urls([" https://A.test/1 ", "https://a.test/2"])
+
+    snapshot = memory.get_processed_urls()
+    assert snapshot == {"https://a.test/1", "https://a.test/2"}
+    assert memory.get_processed_urls() is snapshot
+
+    memory.add_processed_url("https://a.test/3")
+    assert "https://a.test/3" in memory.get_processed_urls()
+    assert memory.get_unprocessed_urls(["https://A.TEST/1", "https://a.test/4"]) == [
+        "https://a.test/4"
+    ]
+
+
+def test_entries_expire_after_ttl(memory, clock):
+    """Test URLs are evicted once they are older than the TTL."""
+    memory.add_processed_url("https://a.test/1")
+    clock(3)
+    memory.add_processed_url("https://a.test/2")
+
+    clock(5)
+    assert memory.clear_old_entries() == 1
+    assert memory.get_processed_urls() == {"https://a.test/2"}
+
+    clock(3)
+    assert memory.get_processed_urls() == frozenset()
+    assert memory.get_processed_count() == 0
+
+
+def test_remarked_url_keeps_its_newest_timestamp(memory, clock):
+    """Test marking a URL again restarts its TTL instead of expiring with the old entry."""
+    memory.add_processed_url("https://a.test/1")
+    clock(5)
+    memory.add_processed_url("https://a.test/1")
+
+    clock(3)
+    assert memory.clear_old_entries() == 0
+    assert memory.is_processed("https://a.test/1")
+
+    clock(5)
+    assert memory.clear_old_entries() == 1
+    assert not memory.is_processed("https://a.test/1")
+
+
+def test_state_round_trip_keeps_timestamps(memory, clock):
+    """Test saved timestamps survive a reload and still drive expiry."""
+    memory.add_processed_url("https://a.test/old")
+    clock(5)
+    memory.add_processed_url("https://a.test/new")
+
+    restored = MemoryManager()
+    restored.load_state(memory.save_state())
+    assert restored.session_ttl_days == 7
+
+    clock(3)
+    assert restored.get_processed_urls() == {"https://a.test/new"}
+
+
+def test_load_state_without_timestamps_counts_as_fresh(memory, clock):
+    """Test states saved before timestamps were recorded start a full TTL on load."""
+    memory.load_state({"processed_urls": ["https://a.test/1"], "ttl_days": 7})
+
+    clock(6)
+    assert memory.get_processed_urls() == {"https://a.test/1"}
+
+    clock(2)
+    assert memory.get_processed_urls() == frozenset()
@@ -0,0 +1,225 @@
+"""
+Test web scraper helpers that don't touch the network
+"""
+
+import pytest
+from datetime import datetime, timezone
+
+import lxml.html
+import requests
+
+from src.tools import web_scraper_tool
+from src.tools.web_scraper_tool import (
+    _detect_content_type,
+    _extract_article_links,
+    _parse_article_html,
+    parse_rss_content,
+    scrape_web_content,
+)
+
+pytestmark = pytest.mark.unit
+
+# HTML fixtures are file-local constants parsed once per module, never rebuilt per test
+SAMPLE_HTML = """
+<html><body>
+  <a href="/2025/11/first-post" title="First">First post</a>
+  <a href="https://other.test/story">Other story</a>
+  <a href="#comments">Comments</a>
+  <a href="/tag/python/">Python</a>
+  <a href="mailto:editor@example.com">Email</a>
+  <a href="ftp://example.com/file">FTP</a>
+  <a>No href</a>
+</body></html>
+"""
+
+
+@pytest.fixture(scope="module")
+def sample_doc():
+    """Parsed lxml tree for SAMPLE_HTML."""
+    return lxml.html.fromstring(SAMPLE_HTML)
+
+
+@pytest.fixture
+def fake_article(monkeypatch, sample_doc):
+    """Replace newspaper's Article with a pre-parsed stand-in."""
+
+    class FakeArticle:
+        title = "First post"
+        text = "Body text " * 100
+        meta_description = ""
+        authors = ["Ada", "Grace"]
+        publish_date = datetime(2025, 11, 30, tzinfo=timezone.utc)
+        top_image = "https://example.com/cover.jpg"
+        images = {"https://example.com/cover.jpg"}
+        clean_doc = sample_doc
+
+        def __init__(self, url):
+            self.url = url
+
+        def download(self, input_html=None):
+            pass
+
+        def parse(self):
+            pass
+
+    monkeypatch.setattr("newspaper.Article", FakeArticle)
+    return FakeArticle
+
+
+def test_parse_article_html(fake_article):
+    """Test article fields are mapped into the scraper result."""
+    result = _parse_article_html("https://example.com/blog/", "<html></html>", extract_links=True)
+    assert result["title"] == "First post"
+    assert result["author"] == "Ada, Grace"
+    assert result["published_date"] == "2025-11-30T00:00:00+00:00"
+    # Falls back to the start of the text when there is no meta description
+    assert result["summary"] == fake_article.text[:500]
+    assert [link["url"] for link in result["links"]] == [
+        "https://example.com/2025/11/first-post",
+        "https://other.test/story",
+    ]
+
+
+@pytest.mark.parametrize(
+    "head",
+    ['<meta charset="utf-8">', ""],
+    ids=["meta_charset", "detected"],
+)
+def test_parse_html_page_decodes_utf8_without_header_charset(monkeypatch, head):
+    """Test a UTF-8 page served as plain text/html isn't decoded as ISO-8859-1."""
+    body = f"<html><head>{head}</head><body><p>{'Café naïve – déjà vu. ' * 20}</p></body></html>"
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body.encode("utf-8")
+    response.headers["Content-Type"] = "text/html"
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+
+    pages = []
+    monkeypatch.setattr(web_scraper_tool._session, "get", lambda url, **kw: response)
+    monkeypatch.setattr(
+        web_scraper_tool,
+        "_parse_article_html",
+        lambda url, html, extract_links: pages.append(html) or {"success": True},
+    )
+
+    web_scraper_tool._parse_html_page("https://example.com/post", False, 30)
+
+    assert pages == [body]
+
+
+def test_parse_rss_content_drops_script_and_style():
+    """Test entry HTML is sanitized so script/style bodies never reach excerpts."""
+    feed = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Blog</title>
+<item><title>Post</title><link>https://example.com/post</link>
+<description><![CDATA[<p>Hello</p><script>alert(1)</script><style>p{color:red}</style>]]></description>
+</item></channel></rss>"""
+
+    summary = parse_rss_content("https://example.com/feed", feed)["entries"][0]["summary"]
+
+    assert "Hello" in summary
+    assert "alert(1)" not in summary
+    assert "color:red" not in summary
+
+
+def test_extract_article_links(sample_doc):
+    """Test article links are resolved and non-article links are skipped."""
+    links = _extract_article_links("https://example.com/blog/", sample_doc)
+    assert links == [
+        {"url": "https://example.com/2025/11/first-post", "text": "First post", "title": "First"},
+        {"url": "https://other.test/story", "text": "Other story", "title": ""},
+    ]
+
+
+def test_extract_article_links_without_document():
+    """Test a page that failed to parse yields no links."""
+    assert _extract_article_links("https://example.com/", None) == []
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/feed/",
+        "https://example.com/rss.xml",
+        "https://example.com/atom",
+        "https://example.com/blog/feed.xml",
+    ],
+)
+def test_detect_rss_from_url(url):
+    """Test feed-looking URLs are detected without a network probe."""
+    assert _detect_content_type(url) == "rss"
+
+
+class _HtmlHeadResponse:
+    """Stand-in for a HEAD response served as an HTML page."""
+
+    headers = {"Content-Type": "text/html; charset=utf-8"}
+
+    def close(self):
+        pass
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/2025/11/article",
+        "https://example.com/blog/post.html",
+        "https://example.com/",
+    ],
+)
+def test_detect_html_from_url(monkeypatch, url):
+    """Test non-feed URLs fall back to the HEAD probe's Content-Type."""
+    monkeypatch.setattr(web_scraper_tool, "_content_type_cache", {})
+    monkeypatch.setattr(web_scraper_tool._session, "head", lambda *a, **kw: _HtmlHeadResponse())
+    assert _detect_content_type(url) == "html"
+
+
+def test_detect_content_type_cache_keeps_query(monkeypatch):
+    """Test a cached page doesn't answer for its ?feed=rss2 feed URL."""
+    content_types = {
+        "https://blog.test/": "text/html",
+        "https://blog.test/?feed=rss2": "application/rss+xml",
+    }
+
+    class HeadResponse:
+        def __init__(self, url):
+            self.headers = {"Content-Type": content_types[url]}
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(web_scraper_tool, "_content_type_cache", {})
+    monkeypatch.setattr(web_scraper_tool._session, "head", lambda url, **kw: HeadResponse(url))
+
+    assert _detect_content_type("https://blog.test/") == "html"
+    assert _detect_content_type("https://blog.test/?feed=rss2") == "rss"
+
+
+def test_content_type_cache_is_bounded(monkeypatch):
+    """Test the probe cache evicts its oldest entries once full."""
+    monkeypatch.setattr(web_scraper_tool, "_content_type_cache", {})
+    monkeypatch.setattr(web_scraper_tool, "CONTENT_TYPE_CACHE_SIZE", 2)
+
+    for page in range(3):
+        web_scraper_tool._cache_content_type(f"https://example.com/{page}", "html")
+
+    assert list(web_scraper_tool._content_type_cache) == [
+        "https://example.com/1",
+        "https://example.com/2",
+    ]
+
+
+def test_run_auto_mode_rss(monkeypatch):
+    """Test auto mode routes a detected feed to the RSS parser."""
+    calls = []
+    monkeypatch.setattr(web_scraper_tool, "_detect_content_type", lambda url: "rss")
+    monkeypatch.setattr(
+        web_scraper_tool,
+        "_parse_rss_feed",
+        lambda url, timeout: calls.append((url, timeout)) or {"success": True, "type": "rss"},
+    )
+
+    result = scrape_web_content("https://example.com/feed", mode="auto")
+
+    assert result == {"success": True, "type": "rss"}
+    assert calls == [("https://example.com/feed", 30)]
@@ -0,0 +1,219 @@
+"""
+Test WordPress category handling against a canned REST API
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import orjson
+import pytest
+import requests
+
+from src.tools import wordpress_tool
+
+pytestmark = pytest.mark.unit
+
+CATEGORIES_URL = wordpress_tool._CATEGORIES_URL
+POSTS_URL = wordpress_tool._POSTS_URL
+
+# Category listing served by the fake site; names come back HTML-escaped
+EXISTING_CATEGORIES = [
+    {"id": 5, "name": "WeeklySummary"},
+    {"id": 7, "name": "AI &amp; ML"},
+]
+
+
+class FakeResponse:
+    """Minimal requests.Response stand-in carrying a JSON payload."""
+
+    def __init__(self, payload, status_code=200):
+        self.content = orjson.dumps(payload)
+        self.status_code = status_code
+        self.ok = status_code < 400
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.HTTPError(f"{self.status_code} Error")
+
+
+class FakeSession:
+    """Dispatches (method, url) to a shared route table and records each call."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = []
+        self.sent = []
+
+    def _dispatch(self, method, url, **kwargs):
+        self.calls.append((method, url))
+        if "data" in kwargs:
+            self.sent.append(orjson.loads(kwargs["data"]))
+        route = self.routes[(method, url)]
+        return route(**kwargs) if callable(route) else route
+
+    def get(self, url, **kwargs):
+        return self._dispatch("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self._dispatch("POST", url, **kwargs)
+
+
+def _create_category(data, **kwargs):
+    """Echo a created category back with a fresh ID."""
+    return FakeResponse({"id": 10, "name": orjson.loads(data)["name"]}, status_code=201)
+
+
+def _unreachable(**kwargs):
+    raise requests.ConnectionError("site unreachable")
+
+
+def _create_post(data, **kwargs):
+    """Accept a post and return it with an ID and link."""
+    return FakeResponse({"id": 42, "link": "https://example.com/?p=42", **orjson.loads(data)})
+
+
+# Route tables are built once per module; tests only pick one
+ONLINE_ROUTES = {
+    ("GET", CATEGORIES_URL): FakeResponse(EXISTING_CATEGORIES),
+    ("POST", CATEGORIES_URL): _create_category,
+    ("POST", POSTS_URL): _create_post,
+}
+FAILING_ROUTES = {
+    ("GET", CATEGORIES_URL): FakeResponse({"code": "rest_error"}, status_code=500),
+    ("POST", CATEGORIES_URL): _unreachable,
+}
+
+
+@pytest.fixture
+def wp_site(monkeypatch):
+    """Point the tool at a fake session with an empty category cache."""
+    monkeypatch.setattr(wordpress_tool, "_category_id_cache", {})
+    monkeypatch.setattr(wordpress_tool, "_categories_loaded", False)
+
+    def serve(routes):
+        session = FakeSession(routes)
+        monkeypatch.setattr(wordpress_tool, "_get_session", lambda: session)
+        return session
+
+    return serve
+
+
+@pytest.fixture
+def category_cache(monkeypatch):
+    """Resolve category names from a fixed table instead of the API."""
+    cache = {"WeeklySummary": 5, "NewCategory": 10}
+    monkeypatch.setattr(
+        wordpress_tool,
+        "_get_or_create_categories",
+        lambda names: [cache[name] for name in names if name in cache],
+    )
+    return cache
+
+
+class _UnavailableListingHandler(BaseHTTPRequestHandler):
+    """Answers every category GET with a 503 and creates categories on POST."""
+
+    def do_GET(self):
+        self._reply(503, {"code": "unavailable"})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self._reply(201, {"id": 10, "name": orjson.loads(body)["name"]})
+
+    def _reply(self, status, payload):
+        body = orjson.dumps(payload)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def unavailable_site(monkeypatch):
+    """Real pooled session against a local server whose category GETs fail."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _UnavailableListingHandler)
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+
+    monkeypatch.setattr(
+        wordpress_tool, "_CATEGORIES_URL", f"http://127.0.0.1:{server.server_port}/categories"
+    )
+    monkeypatch.setattr(wordpress_tool, "_category_id_cache", {})
+    monkeypatch.setattr(wordpress_tool, "_categories_loaded", False)
+    wordpress_tool._get_session.cache_clear()
+    session = wordpress_tool._get_session()
+    session.trust_env = False
+    # Keep the retries but skip their backoff sleeps
+    session.get_adapter("http://").max_retries.backoff_factor = 0
+
+    yield server
+
+    session.close()
+    wordpress_tool._get_session.cache_clear()
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_or_create_categories_existing(wp_site):
+    """Test existing categories resolve from one listing, matched case-insensitively."""
+    session = wp_site(ONLINE_ROUTES)
+    assert wordpress_tool._get_or_create_categories(["WeeklySummary", " ai & ml "]) == [5, 7]
+    assert session.calls == [("GET", CATEGORIES_URL)]
+
+
+def test_get_or_create_categories_create_new(wp_site):
+    """Test a missing category is created and cached for later lookups."""
+    session = wp_site(ONLINE_ROUTES)
+    assert wordpress_tool._get_or_create_categories(["WeeklySummary", "NewCategory"]) == [5, 10]
+    assert wordpress_tool._get_or_create_categories(["newcategory"]) == [10]
+    assert session.calls == [("GET", CATEGORIES_URL), ("POST", CATEGORIES_URL)]
+
+
+def test_get_or_create_categories_handles_errors(wp_site):
+    """Test failed listing, search and create calls yield no IDs instead of raising."""
+    wp_site(FAILING_ROUTES)
+    assert wordpress_tool._get_or_create_categories(["WeeklySummary"]) == []
+
+
+def test_get_or_create_categories_survives_exhausted_retries(unavailable_site):
+    """Test a listing and search that keep failing fall through to creating the category."""
+    assert wordpress_tool._get_or_create_categories(["NewCategory"]) == [10]
+
+
+def test_get_or_create_categories_skips_blank_names(wp_site):
+    """Test blank names never reach the API."""
+    session = wp_site(ONLINE_ROUTES)
+    assert wordpress_tool._get_or_create_categories(["", "  "]) == []
+    assert session.calls == []
+
+
+@pytest.mark.parametrize(
+    "categories,expected_ids",
+    [
+        (["WeeklySummary"], [5]),
+        (["WeeklySummary", "NewCategory"], [5, 10]),
+        (["Unknown"], []),
+        ([], []),
+    ],
+)
+def test_publish_to_wordpress_sends_category_ids(wp_site, category_cache, categories, expected_ids):
+    """Test the published post carries the resolved category IDs."""
+    session = wp_site(ONLINE_ROUTES)
+    result = wordpress_tool.publish_to_wordpress(
+        title="Weekly Summary",
+        content="<p>Hello</p>",
+        status="private",
+        categories=categories,
+        excerpt="",
+    )
+    assert session.sent[-1]["categories"] == expected_ids
+    assert result == {
+        "success": True,
+        "post_id": 42,
+        "post_url": "https://example.com/?p=42",
+        "edit_url": f"{wordpress_tool._site_url}/wp-admin/post.php?post=42&action=edit",
+        "status": "private",
+    }